@@ -0,0 +1,78 @@
+"""Run the benchmark suite and compare it with a stored baseline.
+
+    python -m benchmarks                          # everything, results.json
+    python -m benchmarks --suite autocorrect --scale 0.2
+    python -m benchmarks --save-baseline          # record benchmarks/baseline.json
+    python -m benchmarks --threshold 0.25         # exit 1 on >25% p50/p95 growth
+
+Install the extra dependencies with ``pip install -r benchmarks/requirements.txt``.
+Results are only comparable on the same machine and settings.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+
+from benchmarks.endpoints import endpoints
+from benchmarks.harness import compare, load_results
+from benchmarks.services import SUITES
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Offline benchmark suite")
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES) + ["endpoints"],
+                        help="Suites to run (repeatable); default all")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for iteration counts")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients for endpoint scenarios")
+    parser.add_argument("--output", default="results.json", help="Where to write the JSON results")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative p50/p95 growth")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results as the baseline")
+    args = parser.parse_args(argv)
+
+    # Benchmarks load the models and data files relative to the repository root
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ.setdefault("MODEL_LOADING", "lazy")
+
+    suites = args.suite or sorted(SUITES) + ["endpoints"]
+    results = []
+    for suite in suites:
+        print(f"Running {suite}...", file=sys.stderr)
+        if suite == "endpoints":
+            results += endpoints(args.scale, args.concurrency)
+        else:
+            results += SUITES[suite](args.scale)
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        regressions = compare(results, load_results(args.baseline), args.threshold)
+
+    report = {
+        "created": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scale": args.scale,
+        "results": results,
+        "regressions": regressions,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+
+    for result in results:
+        print(f"{result['name']:<48} p50 {result['p50_ms']:>9.3f} ms  p95 {result['p95_ms']:>9.3f} ms  "
+              f"p99 {result['p99_ms']:>9.3f} ms  {result['throughput_per_s']:>9} /s")
+    for regression in regressions:
+        print(f"REGRESSION {regression['name']} {regression['metric']}: {regression['baseline']} -> "
+              f"{regression['current']} ms ({regression['change']:+.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Deterministic synthetic inputs: misspellings, prefixes, article texts and a news corpus."""
+import hashlib
+import random
+from datetime import datetime, timedelta
+from string import ascii_lowercase
+from typing import Any, Dict, List
+
+from bson import ObjectId
+
+TOPICS = {
+    "business": "market stocks shares investors earnings profit revenue bank economy inflation trade company "
+                "quarter growth prices oil dollar bonds merger deal",
+    "sports": "match team season league coach goal player win final championship score tournament cup "
+              "injury transfer club game race title",
+    "technology": "software chip phone app users data cloud startup device security launch update ai "
+                  "internet platform computer network battery",
+    "politics": "election government minister president vote parliament policy party campaign law court "
+                "senate reform leader debate bill",
+    "entertainment": "film movie music album star show series actor festival award concert fans director "
+                     "release box office",
+}
+
+# Articles seeded into mongomock; it scans and copies documents in Python, so
+# larger corpora mostly measure the stand-in rather than the service
+CORPUS_SIZE = 2000
+
+SOURCES = ["Reuters", "Yahoo Finance", "BBC News", "The Guardian", "Associated Press", "Bloomberg",
+           "ESPN", "TechCrunch", "The Verge", "Al Jazeera", "CNBC", "Variety"]
+
+
+def frequent_words(word_counts: Dict[str, int], n: int = 5000, min_length: int = 4) -> List[str]:
+    words = [w for w in word_counts if len(w) >= min_length and w.isalpha()]
+    return sorted(words, key=lambda w: (-word_counts[w], w))[:n]
+
+
+def misspell(word: str, rng: random.Random, edits: int = 1) -> str:
+    """Apply ``edits`` random deletes, inserts, replaces or transposes."""
+    for _ in range(edits):
+        i = rng.randrange(len(word))
+        op = rng.choice("dirt" if len(word) > 2 else "ir")
+        if op == "d":
+            word = word[:i] + word[i + 1:]
+        elif op == "i":
+            word = word[:i] + rng.choice(ascii_lowercase) + word[i:]
+        elif op == "r":
+            word = word[:i] + rng.choice(ascii_lowercase) + word[i + 1:]
+        elif i < len(word) - 1:
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word
+
+
+def misspellings(word_counts: Dict[str, int], n: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    words = frequent_words(word_counts)
+    return [misspell(rng.choice(words), rng, edits=rng.choice((1, 1, 2))) for _ in range(n)]
+
+
+def prefixes(word_counts: Dict[str, int], n: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    words = frequent_words(word_counts)
+    return [word[:rng.randint(1, 4)] for word in rng.choices(words, k=n)]
+
+
+def article_text(rng: random.Random, topic: str, filler: List[str], words: int) -> str:
+    keywords = TOPICS[topic].split()
+    return " ".join(rng.choice(keywords) if rng.random() < 0.25 else rng.choice(filler) for _ in range(words))
+
+
+def articles(n: int, seed: int = 0, filler: List[str] = None) -> List[Dict[str, Any]]:
+    """News documents as the crawler stores them, spread over the last week."""
+    rng = random.Random(seed)
+    filler = filler or [w for words in TOPICS.values() for w in words.split()] + \
+        "the a of to in and for on with said that at by from new after over".split()
+    now = datetime.utcnow().replace(microsecond=0)
+    docs = []
+    for i in range(n):
+        topic = rng.choice(list(TOPICS))
+        source = rng.choice(SOURCES)
+        content = article_text(rng, topic, filler, rng.randint(150, 600))
+        docs.append({
+            "_id": ObjectId(),
+            "title": article_text(rng, topic, filler, rng.randint(6, 12)).capitalize(),
+            "content": content,
+            "sourceUrl": f"https://news.example.com/{topic}/{i}",
+            "sourceName": source,
+            "sourceNameLower": source.lower(),
+            "contentHash": hashlib.sha256(f"{i}:{content}".encode()).hexdigest(),
+            "crawledAt": now - timedelta(seconds=rng.randint(0, 7 * 24 * 3600)),
+            "category": topic,
+        })
+    return docs
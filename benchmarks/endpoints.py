@@ -0,0 +1,100 @@
+"""End-to-end load scenarios against the FastAPI app.
+
+MongoDB is replaced by mongomock-motor seeded with a synthetic corpus and
+Redis is not used, so the numbers cover routing, validation, caching,
+serialization and model inference but not a real database. Full-text
+search and view=summary need server-side operators mongomock lacks
+($text, $substrCP) and are not covered.
+"""
+import asyncio
+import copy
+from typing import Any, Dict, List
+
+from benchmarks import data
+from benchmarks.harness import load
+
+
+async def _scenarios(scale: float, concurrency: int) -> List[Dict[str, Any]]:
+    from httpx import AsyncClient
+    from mongomock_motor import AsyncMongoMockClient
+
+    import database
+    from main import app
+    from services.news_service import COUNT_CACHE, FACETS_CACHE
+    from services.response_cache import response_cache
+    from utils.model_registry import registry
+
+    corpus = data.articles(data.CORPUS_SIZE, seed=3)
+    collection = AsyncMongoMockClient()["bench"]["news"]
+    await collection.insert_many(copy.deepcopy(corpus))
+    database.database.collection = collection
+    registry.load_all()
+
+    word_counts = registry.get("autocorrect.word_counts")
+    typos = data.misspellings(word_counts, 1000, seed=4)
+    starts = data.prefixes(word_counts, 1000, seed=4)
+    texts = [f"{doc['title']}\n{doc['content']}" for doc in corpus[:500]]
+    ids = [str(doc["_id"]) for doc in corpus]
+    topics = list(data.TOPICS)
+    n = lambda count: max(concurrency, int(count * scale))
+    bulk_payloads = [_ndjson(i) for i in range(n(20) + 2)]
+
+    def cold():
+        response_cache.local.clear()
+        COUNT_CACHE.clear()
+        FACETS_CACHE.clear()
+
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        async def get(url: str, **params):
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+
+        async def post(url: str, **kwargs):
+            response = await client.post(url, **kwargs)
+            response.raise_for_status()
+
+        scenarios = [
+            ("GET /news", lambda i: get("/api/v1/news", page=1 + i % 50, page_size=20), 300),
+            ("GET /news?fields", lambda i: get(
+                "/api/v1/news", page=1 + i % 50, page_size=50, fields="title,sourceName"), 300),
+            ("GET /news?source_name", lambda i: get(
+                "/api/v1/news", source_name=data.SOURCES[i % len(data.SOURCES)], page=1 + i % 5), 300),
+            ("GET /news?facets", lambda i: get(
+                "/api/v1/news", category=topics[i % len(topics)], facets="true", page=1 + i % 20), 200),
+            ("GET /news/{id}", lambda i: get(f"/api/v1/news/{ids[i % len(ids)]}"), 500),
+            ("GET /autocorrect/v1", lambda i: get("/api/v1/autocorrect/v1", word=typos[i % len(typos)]), 300),
+            ("GET /autocorrect/v1/suggest", lambda i: get(
+                "/api/v1/autocorrect/v1/suggest", word=typos[i % len(typos)]), 1000),
+            ("GET /autocomplete/v1", lambda i: get(
+                "/api/v1/autocomplete/v1", prefix=starts[i % len(starts)]), 1000),
+            ("POST /classify/logistic", lambda i: post(
+                "/api/v1/classify/logistic", json=texts[i % len(texts)]), 500),
+            ("POST /classify/logistic/batch", lambda i: post(
+                "/api/v1/classify/logistic/batch", json={"texts": texts[i % 400:i % 400 + 64]}), 50),
+            ("POST /news/bulk", lambda i: post("/api/v1/news/bulk", content=bulk_payloads[i], headers={
+                "content-type": "application/x-ndjson"}), 20),
+        ]
+
+        results = []
+        for name, request, requests in scenarios:
+            cold()
+            results.append(await load(f"e2e.{name}", request, n(requests), concurrency, warmup=2))
+        return results
+
+
+def _ndjson(i: int) -> bytes:
+    import orjson
+
+    docs = data.articles(100, seed=1000 + i)
+    for doc in docs:
+        del doc["_id"], doc["category"]
+    return b"\n".join(orjson.dumps(doc) for doc in docs)
+
+
+def endpoints(scale: float, concurrency: int = 16) -> List[Dict[str, Any]]:
+    from services.classification_executor import executor
+
+    try:
+        return asyncio.run(_scenarios(scale, concurrency))
+    finally:
+        executor.shutdown()
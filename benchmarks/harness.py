@@ -0,0 +1,100 @@
+import asyncio
+import json
+import resource
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+
+def peak_rss_mib() -> float:
+    """Peak resident set size of this process so far, in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return round(peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10, 1)
+
+
+def summarize(name: str, latencies: List[float], elapsed: float, **extra: Any) -> Dict[str, Any]:
+    """Latency percentiles (ms), throughput and peak RSS for one benchmark."""
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 4)
+
+    return {
+        "name": name,
+        "iterations": len(ordered),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 4),
+        "throughput_per_s": round(len(ordered) / elapsed, 1) if elapsed else None,
+        "peak_rss_mib": peak_rss_mib(),
+        **extra,
+    }
+
+
+def bench(name: str, fn: Callable[[Any], Any], inputs: Sequence[Any], iterations: int,
+          warmup: int = 0, setup: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+    """Time ``fn(input)`` for ``iterations`` calls cycling through ``inputs``.
+
+    ``setup`` runs before every call outside the timed region, e.g. to clear
+    a cache so each call measures the uncached path.
+    """
+    for i in range(warmup):
+        fn(inputs[i % len(inputs)])
+    latencies = []
+    for i in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn(inputs[i % len(inputs)])
+        latencies.append(time.perf_counter() - start)
+    return summarize(name, latencies, sum(latencies))
+
+
+async def load(name: str, request: Callable[[int], Awaitable[Any]], requests: int, concurrency: int,
+               warmup: int = 0) -> Dict[str, Any]:
+    """Issue ``requests`` calls of ``request(i)`` from ``concurrency`` concurrent clients.
+
+    Warm-up calls use indices ``requests .. requests + warmup - 1``.
+    """
+    for i in range(requests, requests + warmup):
+        await request(i)
+    latencies = []
+    counter = iter(range(requests))
+
+    async def client():
+        for i in counter:
+            start = time.perf_counter()
+            await request(i)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return summarize(name, latencies, time.perf_counter() - start, concurrency=concurrency)
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+            threshold: float) -> List[Dict[str, Any]]:
+    """Benchmarks whose p50 or p95 grew by more than ``threshold`` over the baseline."""
+    previous = {result["name"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        base = previous.get(result["name"])
+        if base is None:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            if base[metric] and result[metric] > base[metric] * (1 + threshold):
+                regressions.append({
+                    "name": result["name"],
+                    "metric": metric,
+                    "baseline": base[metric],
+                    "current": result[metric],
+                    "change": round(result[metric] / base[metric] - 1, 3),
+                })
+    return regressions
+
+
+def load_results(path: str) -> List[Dict[str, Any]]:
+    with open(path) as f:
+        return json.load(f)["results"]
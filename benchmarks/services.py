@@ -0,0 +1,122 @@
+"""Microbenchmarks for the service-layer hot paths."""
+import asyncio
+import copy
+import random
+from typing import Any, Dict, List
+
+from benchmarks import data
+from benchmarks.harness import bench
+
+
+def autocorrect(scale: float) -> List[Dict[str, Any]]:
+    from services import auto_correct_service as service
+    from utils.model_registry import registry
+
+    word_counts = registry.get("autocorrect.word_counts")
+    typos = data.misspellings(word_counts, 500)
+    starts = data.prefixes(word_counts, 500)
+    sentences = [" ".join(typos[i:i + 40]) for i in range(0, len(typos), 40)]
+    n = lambda count: max(10, int(count * scale))
+    clear = service.LOOKUP_CACHE.clear
+
+    return [
+        bench("autocorrect.get_candidates", service.get_candidates, typos, n(200), warmup=5, setup=clear),
+        bench("autocorrect.get_candidates.cached", service.get_candidates, typos[:50], n(2000), warmup=50),
+        bench("autocorrect.correct", service.correct, typos, n(500), warmup=5, setup=clear),
+        bench("autocorrect.auto_suggest", service.auto_suggest, typos, n(1000), warmup=5, setup=clear),
+        bench("autocorrect.autocomplete", service.autocomplete, starts, n(2000), warmup=5, setup=clear),
+        bench(
+            "autocorrect.batch_suggest.40_tokens",
+            lambda text: service.batch_suggest([token for token, _, _ in service.tokenize(text)]),
+            sentences, n(100), warmup=2, setup=clear
+        ),
+    ]
+
+
+def classification(scale: float) -> List[Dict[str, Any]]:
+    from services import logistic_classification_service, naive_bayes_classification_service
+
+    rng = random.Random(0)
+    texts = [f"{doc['title']}\n{doc['content']}" for doc in data.articles(256, seed=1)]
+    batches = [rng.sample(texts, 64) for _ in range(8)]
+    n = lambda count: max(5, int(count * scale))
+
+    results = []
+    for name, service in (("logistic", logistic_classification_service),
+                          ("naive_bayes", naive_bayes_classification_service)):
+        results += [
+            bench(f"classify.{name}.predict_category", service.predict_category, texts, n(200), warmup=3),
+            bench(f"classify.{name}.predict_categories.64", service.predict_categories, batches, n(20), warmup=1),
+        ]
+    return results
+
+
+def news(scale: float) -> List[Dict[str, Any]]:
+    from mongomock_motor import AsyncMongoMockClient
+
+    from config import settings
+    from schemas import NewsView
+    from services.news_service import COUNT_CACHE, FACETS_CACHE, NewsService
+    from services.search_index import BM25Index, SearchIndexer
+
+    corpus = data.articles(data.CORPUS_SIZE, seed=2)
+    pages = [copy.deepcopy(corpus[i:i + 21]) for i in range(0, 21 * 20, 21)]
+    n = lambda count: max(10, int(count * scale))
+    service = NewsService(None)
+
+    def build(as_json: bool, debug: bool):
+        def run(page):
+            settings.DEBUG = debug
+            try:
+                service._build_news_response([dict(a) for a in page], len(corpus), 2, 20, as_json=as_json)
+            finally:
+                settings.DEBUG = False
+        return run
+
+    collection = AsyncMongoMockClient()["bench"]["news"]
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(collection.insert_many(copy.deepcopy(corpus)))
+    mongo_service = NewsService(collection)
+    sources = [source.split()[0] for source in data.SOURCES]
+    bm25 = BM25Index()
+    loop.run_until_complete(SearchIndexer(collection, bm25).run_once())
+    keywords = [word for words in data.TOPICS.values() for word in words.split()]
+    queries = [" ".join(random.Random(i).sample(keywords, 3)) for i in range(100)]
+
+    def listing(i):
+        COUNT_CACHE.clear()
+        loop.run_until_complete(mongo_service.get_news_paginated(
+            page=1 + i % 10, page_size=20, source_name=sources[i % len(sources)], as_json=True
+        ))
+
+    def clear_facets():
+        FACETS_CACHE.clear()
+        COUNT_CACHE.clear()
+
+    def facets(i):
+        loop.run_until_complete(mongo_service.get_news_paginated(
+            page=1, page_size=20, category=list(data.TOPICS)[i % len(data.TOPICS)], facets=True,
+            view=NewsView.FULL, as_json=True
+        ))
+
+    try:
+        return [
+            bench("news.build_response.orjson", build(True, False), pages, n(1000), warmup=10),
+            bench("news.build_response.pydantic", build(True, True), pages, n(1000), warmup=10),
+            bench("news.get_news_paginated.source_filter", listing, list(range(100)), n(100), warmup=2),
+            bench("news.get_news_paginated.facets", facets, list(range(100)), n(50), warmup=2, setup=clear_facets),
+            bench("news.get_news_paginated.facets.cached", facets, list(range(100)), n(200), warmup=10),
+            bench("news.search_index.bm25", lambda q: bm25.search(q, limit=21), queries, n(500), warmup=5),
+            bench("news.search_index.bm25.filtered_facets", lambda q: bm25.search(
+                q, source_prefix="b", category="business", limit=21, facets=True
+            ), queries, n(500), warmup=5),
+        ]
+    finally:
+        loop.close()
+
+
+SUITES = {
+    "autocorrect": autocorrect,
+    "classification": classification,
+    "news": news,
+}
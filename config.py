@@ -16,13 +16,71 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "News Microservice"
     VERSION: str = "1.0.0"
+    DEBUG: bool = False  # validate listing responses through pydantic before encoding
+    
+    # Sampling profiler: write collapsed stacks for requests slower than the threshold
+    PROFILE_SLOW_REQUESTS: bool = False
+    PROFILE_THRESHOLD_MS: float = 1000
+    PROFILE_INTERVAL_MS: float = 10
+    PROFILE_DIR: str = "./profiles"
     
     # Pagination defaults
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
     
+    # Summary view: characters of content returned as the snippet
+    SUMMARY_SNIPPET_LENGTH: int = 280
+    
     # Search configuration
+    SEARCH_BACKEND: str = "mongo"  # "mongo" ($text index) or "local" (in-process BM25 index)
     SEARCH_CACHE_TTL: int = 300  # 5 minutes
+    RESPONSE_CACHE_LOCAL_SIZE: int = 1024
+    RESPONSE_CACHE_FRESHNESS_INTERVAL: int = 30  # seconds between newest-crawledAt checks
+
+    # Local search backend: BM25 parameters, incremental indexing by crawledAt
+    # (re-reading LOOKBACK seconds before the newest indexed article) and snapshots
+    SEARCH_BM25_K1: float = 1.2
+    SEARCH_BM25_B: float = 0.75
+    SEARCH_INDEX_BATCH_SIZE: int = 1000
+    SEARCH_INDEX_INTERVAL: float = 10
+    SEARCH_INDEX_LOOKBACK: float = 3600
+    SEARCH_INDEX_SNAPSHOT_PATH: str = "./search_index/snapshot.pkl"  # "" disables snapshots
+    SEARCH_INDEX_SNAPSHOT_INTERVAL: float = 300
+
+    # Seconds between fills of sourceNameLower on crawler-inserted articles; 0 disables
+    SOURCE_NAME_BACKFILL_INTERVAL: float = 60
+
+    # Bulk ingestion: articles per bulk_write (and per classification call)
+    INGEST_BATCH_SIZE: int = 1000
+
+    # Model loading: "lazy" (first use), "startup" (concurrently in the lifespan hook)
+    # or "preload" (at import, so gunicorn --preload workers share the pages)
+    MODEL_LOADING: str = "startup"
+    MODEL_LOADING_WORKERS: int = 4
+
+    # spaCy preprocessing for the logistic classifier: texts per nlp.pipe batch,
+    # worker processes (-1 = all cores) for batches of at least the minimum size
+    SPACY_BATCH_SIZE: int = 256
+    SPACY_N_PROCESS: int = 1
+    SPACY_MULTIPROCESS_MIN_TEXTS: int = 500
+    SPACY_LEMMA_CACHE_SIZE: int = 100000
+
+    # Classification configuration
+    CLASSIFICATION_MAX_BATCH_SIZE: int = 256
+    CLASSIFICATION_EXECUTOR: str = "thread"  # "thread" or "process"
+    CLASSIFICATION_WORKERS: int = 2
+    CLASSIFICATION_BATCH_WINDOW_MS: float = 5.0
+    BACKGROUND_CLASSIFICATION_MODEL: str = "logistic"  # "logistic", "naive_bayes" or "" to disable
+    BACKGROUND_CLASSIFICATION_BATCH_SIZE: int = 500
+    BACKGROUND_CLASSIFICATION_INTERVAL: float = 30  # seconds between passes once caught up
+    BACKGROUND_CLASSIFICATION_LEASE: float = 300  # seconds a worker holds a claimed batch
+
+    # Autocorrect configuration
+    AUTOCORRECT_MAX_BATCH_TOKENS: int = 2000
+    AUTOCORRECT_CACHE_SIZE: int = 50000
+    AUTOCORRECT_CACHE_TTL: int = 3600  # 1 hour
+    AUTOCORRECT_ARTIFACT_DIR: str = "./ai_models/auto_correct/compiled"
+    AUTOCORRECT_MMAP_ARTIFACTS: bool = True
     
     class Config:
         env_file = ".env"
@@ -1,5 +1,5 @@
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import ASCENDING, TEXT
+from pymongo import ASCENDING, DESCENDING, TEXT
 from loguru import logger
 from config import settings
 
@@ -59,6 +59,21 @@ async def create_indexes():
             ("_id", ASCENDING)
         ])
 
+        # Compound index for source-filtered listings, newest first
+        await database.collection.create_index([
+            ("sourceNameLower", ASCENDING),
+            ("crawledAt", DESCENDING)
+        ])
+
+        # Category-filtered listings, newest first; also finds unclassified articles
+        await database.collection.create_index([
+            ("category", ASCENDING),
+            ("crawledAt", DESCENDING)
+        ])
+
+        # Deduplicates ingested stories; fails if the collection already holds duplicates
+        await database.collection.create_index([("contentHash", ASCENDING)], unique=True)
+
         logger.info("Database indexes created successfully")
 
     except Exception as e:
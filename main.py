@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from loguru import logger
@@ -8,24 +9,61 @@ from datetime import datetime
 # Import configuration and database
 from config import settings
 from database import connect_to_mongo, close_mongo_connection, db
+from services.background_classifier import start_background_classifier
+from services.classification_executor import start_classification_executor, stop_classification_executor
+from services.response_cache import response_cache
+from services.search_index import search_index, start_search_indexer
 from routers.auto_correct_router import router as auto_correct_router
 from routers.news_router import router as news_router
 from routers.classification_router import router as classification_router
 from schemas import HealthCheck
+from utils.migrate_source_names import start_source_name_backfill
+from utils.metrics import MetricsMiddleware, SamplingProfiler, metrics
+from utils.model_registry import registry
 
 # Configure logging
 logger.remove()
 logger.add(sys.stdout, format="{time} | {level} | {message}")
 
+if settings.MODEL_LOADING not in ("lazy", "startup", "preload"):
+    raise ValueError(f"Unknown model loading mode: {settings.MODEL_LOADING}")
+if settings.SEARCH_BACKEND not in ("mongo", "local"):
+    raise ValueError(f"Unknown search backend: {settings.SEARCH_BACKEND}")
+if settings.MODEL_LOADING == "preload":
+    registry.load_all(settings.MODEL_LOADING_WORKERS)
+
+
+profiler = SamplingProfiler(
+    interval=settings.PROFILE_INTERVAL_MS / 1000,
+    threshold=settings.PROFILE_THRESHOLD_MS / 1000,
+    directory=settings.PROFILE_DIR
+) if settings.PROFILE_SLOW_REQUESTS else None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up News Microservice")
+    if profiler:
+        profiler.start()
     await connect_to_mongo()
+    if settings.MODEL_LOADING == "startup":
+        await registry.load_all_async(settings.MODEL_LOADING_WORKERS)
+    start_classification_executor()
+    background_classifier = start_background_classifier(db.collection)
+    source_name_backfill = start_source_name_backfill(db.collection)
+    search_indexer = start_search_indexer(db.collection)
     yield
     # Shutdown
     logger.info("Shutting down News Microservice")
+    if background_classifier:
+        await background_classifier.stop()
+    if search_indexer:
+        await search_indexer.stop()
+    if source_name_backfill:
+        await source_name_backfill.stop()
+    await stop_classification_executor()
+    await response_cache.close()
     await close_mongo_connection()
 
 
@@ -33,6 +71,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description="Production-grade news microservice with MongoDB backend",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -45,6 +84,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so latency covers CORS and every route
+app.add_middleware(MetricsMiddleware, profiler=profiler)
+
 # Register both routers with different prefixes or tags
 app.include_router(news_router, prefix="/api/v1", tags=["News"])
 app.include_router(classification_router, prefix="/api/v1", tags=["Classification"])
@@ -57,6 +99,24 @@ async def root():
     return {"message": "News Microservice", "version": settings.VERSION}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Route, service and model latency histograms in Prometheus text format"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/models")
+async def model_status():
+    """Load state, load time and memory growth of each model artifact"""
+    return registry.stats()
+
+
+@app.get("/search/index")
+async def search_index_status():
+    """Size and freshness of the local BM25 index (SEARCH_BACKEND=local)"""
+    return {"backend": settings.SEARCH_BACKEND, **search_index.stats()}
+
+
 @app.get("/health", response_model=HealthCheck)
 async def health_check():
     """Health check endpoint"""
@@ -1,10 +1,43 @@
+from enum import Enum
+from typing import List, Optional
+
 from fastapi import APIRouter, HTTPException, Body, Query
+from pydantic import BaseModel, Field
 
-from services.auto_correct_service import get_candidates, autocomplete, correct, auto_suggest
+from config import settings
+from services.auto_correct_service import (
+    get_candidates, autocomplete, correct, auto_suggest, tokenize, batch_key, batch_suggest, cache_stats,
+    MAX_AUTOCOMPLETE_RESULTS
+)
 
 router = APIRouter()
 
 
+class CorrectionMethod(str, Enum):
+    SUGGEST = "suggest"
+    CORRECT = "correct"
+
+
+class BatchCorrectionRequest(BaseModel):
+    text: Optional[str] = Field(None, description="Free text to tokenize and correct")
+    words: Optional[List[str]] = Field(None, description="Pre-tokenized words to correct")
+    method: CorrectionMethod = CorrectionMethod.SUGGEST
+    max_dist: int = Field(default=2, ge=0, le=2)
+
+
+class TokenCorrection(BaseModel):
+    token: str
+    position: int
+    start: Optional[int] = None
+    end: Optional[int] = None
+    suggestions: List[str]
+
+
+class BatchCorrectionResponse(BaseModel):
+    tokens: List[TokenCorrection]
+    unique_tokens: int
+
+
 @router.get("/autocorrect/v1")
 def autocorrect_endpoint(word: str = Query(..., description="Misspelled word")):
     return {
@@ -22,10 +55,13 @@ def autocorrect_endpoint(word: str = Query(..., description="Misspelled word")):
 
 
 @router.get("/autocomplete/v1")
-def autocomplete_endpoint(prefix: str = Query(..., description="Prefix for autocomplete")):
+def autocomplete_endpoint(
+        prefix: str = Query(..., description="Prefix for autocomplete"),
+        max_results: int = Query(5, ge=1, le=MAX_AUTOCOMPLETE_RESULTS, description="Maximum number of completions")
+):
     return {
         "prefix": prefix,
-        "completions": autocomplete(prefix)
+        "completions": autocomplete(prefix, max_results)
     }
 
 
@@ -35,3 +71,42 @@ def autocorrect_endpoint(word: str = Query(..., description="Misspelled word")):
         "input": word,
         "suggestions": auto_suggest(word)
     }
+
+
+@router.post("/autocorrect/v1/batch", response_model=BatchCorrectionResponse)
+def autocorrect_batch_endpoint(request: BatchCorrectionRequest = Body(...)):
+    """Correct a whole sentence or word list, looking up each distinct token once"""
+    if (request.text is None) == (request.words is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of 'text' or 'words'")
+
+    if request.text is not None:
+        spans = tokenize(request.text)
+    else:
+        spans = [(word, None, None) for word in request.words]
+
+    if len(spans) > settings.AUTOCORRECT_MAX_BATCH_TOKENS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.AUTOCORRECT_MAX_BATCH_TOKENS} tokens per request"
+        )
+
+    suggestions = batch_suggest((token for token, _, _ in spans), request.method.value, request.max_dist)
+    return BatchCorrectionResponse(
+        tokens=[
+            TokenCorrection(
+                token=token,
+                position=position,
+                start=start,
+                end=end,
+                suggestions=suggestions[batch_key(token, request.method.value)]
+            )
+            for position, (token, start, end) in enumerate(spans)
+        ],
+        unique_tokens=len(suggestions)
+    )
+
+
+@router.get("/autocorrect/v1/cache")
+def autocorrect_cache_endpoint():
+    """Hit/miss/eviction counters for the shared lookup cache"""
+    return cache_stats()
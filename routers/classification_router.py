@@ -1,8 +1,12 @@
+from typing import Dict, List, Optional
+
 from fastapi import APIRouter, HTTPException, Body
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from loguru import logger
-from services.logistic_classification_service import predict_category
-from services.naive_bayes_classification_service import predict_category as predict_naive
+
+from config import settings
+from services import logistic_classification_service, naive_bayes_classification_service
+from services.classification_executor import executor, logistic_batcher, naive_bayes_batcher
 
 router = APIRouter()
 
@@ -15,11 +19,32 @@ class ClassificationResponse(BaseModel):
     category: str
 
 
+class BatchClassificationRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1)
+    include_scores: bool = False
+
+
+class BatchClassificationResponse(BaseModel):
+    categories: List[str]
+    scores: Optional[List[Dict[str, float]]] = None
+
+
+async def classify_batch(service, request: BatchClassificationRequest) -> BatchClassificationResponse:
+    """Run one vectorized predict (and optionally predict_proba) over the batch on the worker pool"""
+    if len(request.texts) > settings.CLASSIFICATION_MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.CLASSIFICATION_MAX_BATCH_SIZE} texts per request"
+        )
+    categories, scores = await executor.run(service.classify, request.texts, request.include_scores)
+    return BatchClassificationResponse(categories=categories, scores=scores)
+
+
 @router.post("/classify/logistic", response_model=ClassificationResponse)
 async def classify_news(request: str = Body(...)):
     """Classify the news text into a category"""
     try:
-        category = predict_category(request)
+        category = await logistic_batcher.submit(request)
         return ClassificationResponse(category=category)
     except Exception as e:
         logger.error(f"Error classifying news: {e}")
@@ -30,8 +55,32 @@ async def classify_news(request: str = Body(...)):
 async def classify_news(request: str = Body(...)):
     """Classify the news text into a category"""
     try:
-        category = predict_naive(request)
+        category = await naive_bayes_batcher.submit(request)
         return ClassificationResponse(category=category)
     except Exception as e:
         logger.error(f"Error classifying news: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/classify/logistic/batch", response_model=BatchClassificationResponse)
+async def classify_news_batch(request: BatchClassificationRequest):
+    """Classify many news texts in one call, preserving input order"""
+    try:
+        return await classify_batch(logistic_classification_service, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error classifying news batch: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/classify/naive_bayes/batch", response_model=BatchClassificationResponse)
+async def classify_news_batch(request: BatchClassificationRequest):
+    """Classify many news texts in one call, preserving input order"""
+    try:
+        return await classify_batch(naive_bayes_classification_service, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error classifying news batch: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Optional, Union
 from loguru import logger
+import orjson
 
 from database import get_database
-from services.news_service import NewsService
-from schemas import NewsResponse, NewsArticle, DateRange
+from services.news_service import NewsService, iter_ndjson, normalize_search_query
+from services.response_cache import ResponseCache, get_response_cache
+from schemas import (
+    BulkIngestResponse, NewsResponse, NewsSummaryResponse, PartialNewsResponse, NewsArticle, DateRange, NewsView,
+    StreamFormat
+)
 
 router = APIRouter()
 
@@ -15,39 +21,127 @@ def get_news_service():
     return NewsService(db.collection)
 
 
-@router.get("/news", response_model=NewsResponse)
+@router.get("/news", response_model=Union[NewsResponse, NewsSummaryResponse, PartialNewsResponse])
 async def get_news(
         page: int = Query(1, ge=1, description="Page number"),
         page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
         date_range: Optional[DateRange] = Query(None, description="Filter by date range"),
         source_name: Optional[str] = Query(None, description="Filter by source name"),
-        service: NewsService = Depends(get_news_service)
+        category: Optional[str] = Query(None, description="Filter by precomputed category"),
+        cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides page"),
+        include_total: bool = Query(True, description="Compute total and total_pages"),
+        view: NewsView = Query(NewsView.FULL, description="summary returns a slim article with a content snippet"),
+        fields: Optional[str] = Query(None, description="Comma-separated article fields to return"),
+        facets: bool = Query(False, description="Include per-source and per-day counts"),
+        service: NewsService = Depends(get_news_service),
+        cache: ResponseCache = Depends(get_response_cache)
 ):
     """Get paginated news articles"""
     try:
-        return await service.get_news_paginated(page, page_size, date_range, source_name)
+        key = cache.make_key(
+            endpoint="news", page=page, page_size=page_size, date_range=date_range,
+            source_name=source_name.strip().lower() if source_name else None,
+            category=category, cursor=cursor, include_total=include_total, view=view,
+            fields=service.parse_fields(fields), facets=facets,
+            fresh=await cache.freshness(service.latest_crawled_at)
+        )
+
+        async def render() -> bytes:
+            return await service.get_news_paginated(
+                page, page_size, date_range, source_name, category, cursor, include_total, view, fields, facets,
+                as_json=True
+            )
+
+        return Response(content=await cache.get_or_compute(key, render), media_type="application/json")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching news: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/news/search", response_model=NewsResponse)
+@router.get("/news/search", response_model=Union[NewsResponse, NewsSummaryResponse, PartialNewsResponse])
 async def search_news(
         q: str = Query(..., min_length=1, max_length=500, description="Search query"),
         page: int = Query(1, ge=1, description="Page number"),
         page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
         date_range: Optional[DateRange] = Query(None, description="Filter by date range"),
         source_name: Optional[str] = Query(None, description="Filter by source name"),
-        service: NewsService = Depends(get_news_service)
+        category: Optional[str] = Query(None, description="Filter by precomputed category"),
+        cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides page"),
+        include_total: bool = Query(True, description="Compute total and total_pages"),
+        view: NewsView = Query(NewsView.FULL, description="summary returns a slim article with a content snippet"),
+        fields: Optional[str] = Query(None, description="Comma-separated article fields to return"),
+        facets: bool = Query(False, description="Include per-source and per-day counts"),
+        service: NewsService = Depends(get_news_service),
+        cache: ResponseCache = Depends(get_response_cache)
 ):
     """Search news articles by text"""
     try:
-        return await service.search_news(q, page, page_size, date_range, source_name)
+        key = cache.make_key(
+            endpoint="search", q=normalize_search_query(q), page=page, page_size=page_size,
+            date_range=date_range, source_name=source_name.strip().lower() if source_name else None,
+            category=category, cursor=cursor, include_total=include_total, view=view,
+            fields=service.parse_fields(fields), facets=facets,
+            fresh=await cache.freshness(service.latest_crawled_at)
+        )
+
+        async def render() -> bytes:
+            return await service.search_news(
+                q, page, page_size, date_range, source_name, category, cursor, include_total, view, fields, facets,
+                as_json=True
+            )
+
+        return Response(content=await cache.get_or_compute(key, render), media_type="application/json")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error searching news: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/news/sources")
+async def get_news_sources(service: NewsService = Depends(get_news_service)):
+    """List known source names for the source_name filter"""
+    try:
+        sources = await service.get_sources()
+        return {"sources": sources, "count": len(sources)}
+    except Exception as e:
+        logger.error(f"Error fetching news sources: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/news/bulk", response_model=BulkIngestResponse)
+async def bulk_ingest_news(
+        request: Request,
+        classify: bool = Query(False, description="Store the logistic model's category on each new article"),
+        service: NewsService = Depends(get_news_service)
+):
+    """Ingest a JSON array or an NDJSON stream of articles, skipping duplicate contentHash values"""
+    try:
+        if "ndjson" in request.headers.get("content-type", ""):
+            items = iter_ndjson(request.stream())
+        else:
+            try:
+                payload = orjson.loads(await request.body())
+            except orjson.JSONDecodeError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+            if not isinstance(payload, list):
+                raise HTTPException(status_code=400, detail="Expected a JSON array of articles")
+            items = _iterate(payload)
+        return await service.bulk_ingest(items, classify)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error ingesting news: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+async def _iterate(values):
+    for value in values:
+        yield value
+
+
 @router.get("/news/{article_id}", response_model=NewsArticle)
 async def get_news_by_id(
         article_id: str,
@@ -69,12 +163,24 @@ async def get_news_by_id(
 @router.get("/news/date/{date_range}")
 async def get_news_by_date(
         date_range: DateRange,
+        stream: bool = Query(False, description="Stream results instead of returning one JSON document"),
+        format: StreamFormat = Query(StreamFormat.NDJSON, description="Streaming format"),
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return when streaming"),
         service: NewsService = Depends(get_news_service)
 ):
     """Get news articles for specific date range"""
     try:
+        if stream:
+            projection = service.build_projection(fields)
+            array = format == StreamFormat.JSON
+            return StreamingResponse(
+                service.stream_news_by_date_range(date_range, projection, array=array),
+                media_type="application/json" if array else "application/x-ndjson"
+            )
         articles = await service.get_news_by_date_range(date_range)
         return {"articles": articles, "count": len(articles)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching news by date {date_range}: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -8,6 +8,14 @@ class DateRange(str, Enum):
     YESTERDAY = "yesterday"
     LAST_3_DAYS = "last_3_days"
 
+class NewsView(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+
+class StreamFormat(str, Enum):
+    NDJSON = "ndjson"
+    JSON = "json"
+
 class NewsArticle(BaseModel):
     id: str = Field(alias="_id")
     title: str
@@ -16,6 +24,7 @@ class NewsArticle(BaseModel):
     sourceName: str
     contentHash: str
     crawledAt: datetime
+    category: Optional[str] = None  # precomputed by the background classifier
     
     class Config:
         populate_by_name = True
@@ -23,14 +32,72 @@ class NewsArticle(BaseModel):
             datetime: lambda v: v.isoformat()
         }
 
+class NewsSummary(BaseModel):
+    id: str = Field(alias="_id")
+    title: str
+    snippet: str
+    sourceUrl: str
+    sourceName: str
+    crawledAt: datetime
+    category: Optional[str] = None
+    
+    class Config:
+        populate_by_name = True
+
+class PartialNewsArticle(BaseModel):
+    """Article restricted to the fields requested with ``fields=``"""
+    id: str = Field(alias="_id")
+    title: Optional[str] = None
+    content: Optional[str] = None
+    sourceUrl: Optional[str] = None
+    sourceName: Optional[str] = None
+    contentHash: Optional[str] = None
+    crawledAt: Optional[datetime] = None
+    category: Optional[str] = None
+    
+    class Config:
+        populate_by_name = True
+
+class NewsArticleCreate(BaseModel):
+    """Article as submitted to the bulk ingestion endpoint"""
+    title: str
+    content: str
+    sourceUrl: str
+    sourceName: str
+    contentHash: Optional[str] = None  # sha256 of content when omitted
+    crawledAt: Optional[datetime] = None  # ingestion time when omitted
+
+class BulkIngestResponse(BaseModel):
+    received: int
+    inserted: int
+    duplicates: int
+    failed: int
+    errors: List[str] = []  # first few failures, "item <n>: <reason>"
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class NewsFacets(BaseModel):
+    sources: List[FacetCount]  # per sourceName, most articles first
+    days: List[FacetCount]  # per crawledAt day (YYYY-MM-DD, UTC), newest first
+
 class NewsResponse(BaseModel):
     articles: List[NewsArticle]
-    total: int
+    total: Optional[int] = None  # None when requested with include_total=false
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
+    facets: Optional[NewsFacets] = None  # only when requested with facets=true
+
+class NewsSummaryResponse(NewsResponse):
+    articles: List[NewsSummary]
+
+class PartialNewsResponse(NewsResponse):
+    articles: List[PartialNewsArticle]
 
 class SearchQuery(BaseModel):
     query: str = Field(..., min_length=1, max_length=500)
@@ -1,11 +1,75 @@
 import joblib
-from typing import List
+import numpy as np
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import hashlib
+import heapq
+import json
 import math
+import os
+import pickle
+import re
+import zlib
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import islice
+from string import ascii_lowercase
+from loguru import logger
 from symspellpy import SymSpell, Verbosity
 
-# Load saved model components
-VOCAB = joblib.load('./ai_models/auto_correct/vocab.pkl')
-WORD_COUNTS = joblib.load('./ai_models/auto_correct/word_counts.pkl')
+from config import settings
+from utils.cache import InstrumentedTTLCache, memoized
+from utils.metrics import metrics
+from utils.model_registry import registry
+
+# Shared across correct/get_candidates/autocomplete/auto_suggest
+LOOKUP_CACHE = InstrumentedTTLCache(
+    maxsize=settings.AUTOCORRECT_CACHE_SIZE,
+    ttl=settings.AUTOCORRECT_CACHE_TTL
+)
+
+# Per-call latency, cache hits included
+AUTOCORRECT_SECONDS = metrics.histogram("autocorrect_seconds", "Autocorrect lookup time by function", ["function"])
+
+WORD_COUNTS_PATH = './ai_models/auto_correct/word_counts.pkl'
+SYMSPELL_DICTIONARY_PATH = './data/frequency_dictionary_en_82_765.txt'
+
+# Saved model components, loaded on first use; the vocabulary is the keys of WORD_COUNTS
+registry.register("autocorrect.word_counts", lambda: joblib.load(WORD_COUNTS_PATH))
+
+
+# -----------------------------
+# Precompiled Artifacts
+# -----------------------------
+def source_fingerprint() -> str:
+    """Digest of the raw files every precompiled artifact is derived from."""
+    digest = hashlib.sha1()
+    for path in (WORD_COUNTS_PATH, SYMSPELL_DICTIONARY_PATH):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def artifacts_current(directory: str) -> bool:
+    manifest = os.path.join(directory, "manifest.json")
+    if not directory or not os.path.exists(manifest):
+        return False
+    with open(manifest) as f:
+        return json.load(f).get("fingerprint") == source_fingerprint()
+
+
+ARTIFACT_DIR = settings.AUTOCORRECT_ARTIFACT_DIR
+
+
+@lru_cache(maxsize=None)
+def use_artifacts() -> bool:
+    current = artifacts_current(ARTIFACT_DIR)
+    if ARTIFACT_DIR and not current:
+        logger.warning(
+            f"No current autocorrect artifacts in {ARTIFACT_DIR}; building indexes from source. "
+            f"Run `python -m utils.build_autocorrect_artifacts` to speed up startup."
+        )
+    return current
 
 keyboard_rows = [
     "qwertyuiop",
@@ -27,51 +91,272 @@ def key_distance(c1, c2):
     return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
 
 
+# Substitution costs between key classes: one class per letter key plus a
+# shared "unknown" class, so the DP never recomputes a square root per cell.
+KEY_INDEX = {char: i for i, char in enumerate(sorted(key_positions))}
+UNKNOWN_KEY = len(KEY_INDEX)
+
+SUBSTITUTION_COST = np.full((UNKNOWN_KEY + 1, UNKNOWN_KEY + 1), 2.0)
+for c1, i1 in KEY_INDEX.items():
+    for c2, i2 in KEY_INDEX.items():
+        SUBSTITUTION_COST[i1, i2] = key_distance(c1, c2)
+_SUBSTITUTION_ROWS = SUBSTITUTION_COST.tolist()
+
+_ASCII_KEY_CLASS = np.full(128, UNKNOWN_KEY, dtype=np.intp)
+for char, i in KEY_INDEX.items():
+    _ASCII_KEY_CLASS[ord(char)] = i
+
+
+def _encode(words: Sequence[str], length: int) -> np.ndarray:
+    """Code points of equal-length ``words`` as a ``(len(words), length)`` array."""
+    buffer = "".join(words).encode("utf-32-le")
+    return np.frombuffer(buffer, dtype=np.uint32).reshape(len(words), length)
+
+
+def _key_classes(codes: np.ndarray) -> np.ndarray:
+    return np.where(codes < 128, _ASCII_KEY_CLASS[np.minimum(codes, 127)], UNKNOWN_KEY)
+
+
 # -----------------------------
 # Weighted Edit Distance
 # -----------------------------
-def keyboard_weighted_edit(word1: str, word2: str) -> float:
-    m, n = len(word1), len(word2)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
+def keyboard_weighted_edit(word1: str, word2: str, max_dist: Optional[float] = None) -> float:
+    """Keyboard-weighted Levenshtein distance.
 
-    for i in range(m + 1):
-        dp[i][0] = i
-    for j in range(n + 1):
-        dp[0][j] = j
+    When ``max_dist`` is given the DP stops as soon as every cell of a row
+    exceeds it and ``math.inf`` is returned instead of the exact distance.
+    """
+    m, n = len(word1), len(word2)
+    keys1 = [KEY_INDEX.get(c, UNKNOWN_KEY) for c in word1]
+    keys2 = [KEY_INDEX.get(c, UNKNOWN_KEY) for c in word2]
+    prev = list(range(n + 1))
 
     for i in range(1, m + 1):
+        costs = _SUBSTITUTION_ROWS[keys1[i - 1]]
+        curr = [i] + [0] * n
         for j in range(1, n + 1):
             if word1[i - 1] == word2[j - 1]:
                 cost = 0
             else:
-                cost = key_distance(word1[i - 1], word2[j - 1])
-            dp[i][j] = min(
-                dp[i - 1][j] + 1,  # deletion
-                dp[i][j - 1] + 1,  # insertion
-                dp[i - 1][j - 1] + cost  # substitution
+                cost = costs[keys2[j - 1]]
+            curr[j] = min(
+                prev[j] + 1,  # deletion
+                curr[j - 1] + 1,  # insertion
+                prev[j - 1] + cost  # substitution
+            )
+        if max_dist is not None and min(curr) > max_dist:
+            return math.inf
+        prev = curr
+    return prev[n]
+
+
+def keyboard_weighted_edit_batch(word: str, words: Sequence[str],
+                                 max_dist: Optional[Sequence[float]] = None) -> np.ndarray:
+    """Score ``word`` against many words at once.
+
+    Words are grouped by length and each group runs one DP over its
+    anti-diagonals, so a whole group advances with a single NumPy update per
+    diagonal. Returns distances aligned with ``words``.
+
+    ``max_dist`` gives each word a cut-off: every edit path crosses one of
+    any two consecutive anti-diagonals, so their smaller minimum bounds the
+    final distance from below. Words whose bound exceeds their cut-off get
+    ``math.inf``, and a group stops as soon as all of its words have.
+    """
+    result = np.empty(len(words))
+    limits = np.full(len(words), np.inf) if max_dist is None else np.asarray(max_dist, dtype=float)
+    m = len(word)
+    groups = defaultdict(list)
+    for pos, other in enumerate(words):
+        groups[len(other)].append(pos)
+
+    query = _encode([word], m)[0]
+    query_keys = _key_classes(query)
+    for n, positions in groups.items():
+        if m == 0 or n == 0:
+            result[positions] = max(m, n)
+            continue
+        codes = _encode([words[pos] for pos in positions], n)
+        cost = SUBSTITUTION_COST[query_keys[None, :, None], _key_classes(codes)[:, None, :]]
+        cost[query[None, :, None] == codes[:, None, :]] = 0
+
+        dp = np.empty((len(positions), m + 1, n + 1))
+        dp[:, :, 0] = np.arange(m + 1)
+        dp[:, 0, :] = np.arange(n + 1)
+        limit = limits[positions]
+        bounded = bool(np.isfinite(limit).any())
+        exceeded = np.zeros(len(positions), dtype=bool)
+        previous_min = np.ones(len(positions))  # diagonal 1: cells (0, 1) and (1, 0)
+        for diagonal in range(2, m + n + 1):
+            rows = np.arange(max(1, diagonal - n), min(m, diagonal - 1) + 1)
+            cols = diagonal - rows
+            values = np.minimum(
+                np.minimum(
+                    dp[:, rows - 1, cols] + 1,  # deletion
+                    dp[:, rows, cols - 1] + 1  # insertion
+                ),
+                dp[:, rows - 1, cols - 1] + cost[:, rows - 1, cols - 1]  # substitution
             )
-    return dp[m][n]
+            dp[:, rows, cols] = values
+            if bounded:
+                current_min = values.min(axis=1)
+                if diagonal <= max(m, n):
+                    # Border cells (0, diagonal) / (diagonal, 0) hold ``diagonal``
+                    current_min = np.minimum(current_min, diagonal)
+                exceeded |= np.minimum(previous_min, current_min) > limit
+                if exceeded.all():
+                    break
+                previous_min = current_min
+        result[positions] = np.where(exceeded, np.inf, dp[:, m, n])
+    return result
+
+
+# -----------------------------
+# Candidate Index
+# -----------------------------
+class CandidateIndex:
+    """Length-bucketed vocabulary index for ``get_candidates``.
+
+    Every non-matching edit costs at least 1, so a word of length ``n`` is
+    at least ``abs(n - len(word))`` away from ``word`` and its score can never
+    exceed ``log(count + 1) - abs(n - len(word))``. Words are streamed in
+    decreasing order of that bound and the scan stops once no remaining word
+    can enter the top ``k``. Survivors are scored in growing chunks by the
+    batched kernel, tightening the cut-off after each chunk.
+    """
+
+    def __init__(self, word_counts):
+        buckets = defaultdict(list)
+        for word, count in word_counts.items():
+            buckets[len(word)].append((-math.log(count + 1), word))
+        for bucket in buckets.values():
+            bucket.sort()
+        self.buckets = dict(buckets)
+
+    def _ordered(self, length: int):
+        """Yield ``(-upper_bound, word, log_count)`` in increasing order."""
+        def bucket_stream(bucket, gap):
+            for neg_log, word in bucket:
+                yield neg_log + gap, word, -neg_log
+
+        return heapq.merge(*(
+            bucket_stream(bucket, abs(n - length)) for n, bucket in self.buckets.items()
+        ))
+
+    def top_k(self, word: str, k: int = 5) -> List[str]:
+        best = []  # (-score, word), best first
+        stream = self._ordered(len(word))
+        chunk_size = 4 * k
+        while True:
+            taken, pruned = 0, False
+            shortlist = []
+            for neg_bound, vocab_word, log_count in islice(stream, chunk_size):
+                taken += 1
+                if len(best) == k and -neg_bound < -best[-1][0]:
+                    pruned = True
+                    break
+                shortlist.append((vocab_word, log_count))
+
+            if shortlist:
+                # A word only enters the top k if -dist + log_count reaches the k-th best score
+                limits = [log_count + best[-1][0] if len(best) == k else math.inf for _, log_count in shortlist]
+                dists = keyboard_weighted_edit_batch(word, [w for w, _ in shortlist], limits)
+                for (vocab_word, log_count), dist in zip(shortlist, dists.tolist()):
+                    insort(best, (-(-dist + log_count), vocab_word))
+                del best[k:]
+            if pruned or taken < chunk_size:
+                return [w for _, w in best]
+            chunk_size = min(chunk_size * 2, 4096)
+
+
+registry.register("autocorrect.candidates", lambda: CandidateIndex(registry.get("autocorrect.word_counts")))
 
 
 # -----------------------------
 # Autocorrect Candidates
 # -----------------------------
+@AUTOCORRECT_SECONDS.timed(function="get_candidates")
+@memoized(LOOKUP_CACHE, "get_candidates")
 def get_candidates(word: str) -> List[str]:
-    candidates = []
-    for vocab_word in VOCAB:
-        dist = keyboard_weighted_edit(word, vocab_word)
-        score = -dist + math.log(WORD_COUNTS[vocab_word] + 1)
-        candidates.append((vocab_word, score))
-    candidates.sort(key=lambda x: x[1], reverse=True)
-    return [w for w, _ in candidates[:5]]
+    return registry.get("autocorrect.candidates").top_k(word, 5)
 
 
 # -----------------------------
 # Autocomplete
 # -----------------------------
+# Largest max_results the autocomplete endpoint accepts; every request is served from the precomputed table
+MAX_AUTOCOMPLETE_RESULTS = 50
+
+
+class PrefixIndex:
+    """Sorted-array prefix index with precomputed top-k completions.
+
+    All words sharing a prefix occupy one contiguous slice of the sorted
+    vocabulary, found with two bisections. Prefixes whose slice is wider
+    than ``dense_threshold`` keep their ``top_k`` most frequent words
+    precomputed; narrower slices are ranked on the fly, which is cheap and
+    keeps the table small.
+    """
+
+    def __init__(self, word_counts, top_k: int = MAX_AUTOCOMPLETE_RESULTS, dense_threshold: int = 64,
+                 top: Optional[Dict[str, List[str]]] = None):
+        self.word_counts = word_counts
+        self.words = sorted(word_counts)
+        self.top_k = top_k
+        self.dense_threshold = dense_threshold
+        if top is not None:
+            self.top = top
+            return
+        self.top = {}
+
+        widths = Counter(word[:i] for word in self.words for i in range(1, len(word) + 1))
+        for prefix, width in widths.items():
+            if width > dense_threshold:
+                self.top[prefix] = self._rank(*self._range(prefix), top_k)
+        self.top[""] = self._rank(0, len(self.words), top_k)
+
+    def _range(self, prefix: str):
+        lo = bisect_left(self.words, prefix)
+        hi = bisect_left(self.words, prefix + "\U0010ffff", lo)
+        return lo, hi
+
+    def _rank(self, lo: int, hi: int, k: int) -> List[str]:
+        return heapq.nsmallest(k, self.words[lo:hi], key=lambda w: (-self.word_counts[w], w))
+
+    def complete(self, prefix: str, max_results: int = 5) -> List[str]:
+        cached = self.top.get(prefix)
+        if cached is not None and max_results <= self.top_k:
+            return cached[:max_results]
+        lo, hi = self._range(prefix)
+        return self._rank(lo, hi, max_results)
+
+    def save(self, directory: str):
+        with open(os.path.join(directory, "prefix_top.pkl"), "wb") as f:
+            pickle.dump({"top_k": self.top_k, "dense_threshold": self.dense_threshold, "top": self.top}, f)
+
+    @classmethod
+    def load(cls, directory: str, word_counts) -> "PrefixIndex":
+        with open(os.path.join(directory, "prefix_top.pkl"), "rb") as f:
+            return cls(word_counts, **pickle.load(f))
+
+
+def _load_prefix_index() -> PrefixIndex:
+    word_counts = registry.get("autocorrect.word_counts")
+    if use_artifacts():
+        index = PrefixIndex.load(ARTIFACT_DIR, word_counts)
+        if index.top_k >= MAX_AUTOCOMPLETE_RESULTS:
+            return index
+        logger.warning(f"Precompiled autocomplete table keeps {index.top_k} results; rebuilding it")
+    return PrefixIndex(word_counts)
+
+
+registry.register("autocorrect.prefix", _load_prefix_index)
+
+
+@AUTOCORRECT_SECONDS.timed(function="autocomplete")
+@memoized(LOOKUP_CACHE, "autocomplete", normalize={"prefix": str.lower})
 def autocomplete(prefix: str, max_results: int = 5) -> List[str]:
-    prefix = prefix.lower()
-    return sorted([w for w in VOCAB if w.startswith(prefix)], key=lambda x: -WORD_COUNTS[x])[:max_results]
+    return registry.get("autocorrect.prefix").complete(prefix.lower(), max_results)
 
 
 # ------------
@@ -91,20 +376,130 @@ def edits1(word):
 
 
 def known(words):
-    return set(w for w in words if w in WORD_COUNTS)
+    word_counts = registry.get("autocorrect.word_counts")
+    return set(w for w in words if w in word_counts)
+
+
+def deletes1(word):
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def one_edit_apart(source: str, target: str) -> bool:
+    """True if ``edits1(source)`` produces ``target`` (and they differ)."""
+    m, n = len(source), len(target)
+    if abs(m - n) > 1 or source == target:
+        return False
+    i = 0
+    while i < min(m, n) and source[i] == target[i]:
+        i += 1
+    if m == n + 1:
+        return source[i + 1:] == target[i:]
+    if n == m + 1:
+        return target[i] in ascii_lowercase and target[i + 1:] == source[i:]
+    if target[i] in ascii_lowercase and source[i + 1:] == target[i + 1:]:
+        return True
+    return i + 1 < m and source[i] == target[i + 1] and source[i + 1] == target[i] \
+        and source[i + 2:] == target[i + 2:]
+
+
+def _delete_key(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8")) | (len(text) << 32)
+
+
+class DeletesIndex:
+    """Symmetric-delete index over the vocabulary for edit-distance-2 lookups.
+
+    Each word is filed under itself and its single-character deletes, stored
+    as a sorted array of 64-bit key hashes plus word ids rather than a dict
+    of strings. Two strings one edit apart always share such a key, so the
+    words two edits from ``word`` are found by looking up the keys of
+    ``edits1(word)`` -- a few thousand probes instead of materializing the
+    full edits-of-edits set. Hash hits are confirmed with ``one_edit_apart``.
+
+    The arrays can be saved once and memory-mapped on startup, so forked or
+    co-located workers share a single copy through the page cache.
+    """
+
+    def __init__(self, words: List[str], counts, hashes: np.ndarray, ids: np.ndarray):
+        self.words = words
+        self.counts = counts
+        self.hashes = hashes
+        self.ids = ids
+
+    @classmethod
+    def build(cls, word_counts) -> "DeletesIndex":
+        words = list(word_counts)
+        hashes, ids = [], []
+        for word_id, word in enumerate(words):
+            for key in deletes1(word) | {word}:
+                hashes.append(_delete_key(key))
+                ids.append(word_id)
+        hashes = np.array(hashes, dtype=np.int64)
+        order = np.argsort(hashes, kind="stable")
+        return cls(words, word_counts, hashes[order], np.array(ids, dtype=np.int32)[order])
+
+    def save(self, directory: str):
+        np.save(os.path.join(directory, "deletes_hashes.npy"), self.hashes)
+        np.save(os.path.join(directory, "deletes_ids.npy"), self.ids)
+        with open(os.path.join(directory, "deletes_words.pkl"), "wb") as f:
+            pickle.dump(self.words, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, directory: str, word_counts, mmap: bool = True) -> "DeletesIndex":
+        mmap_mode = "r" if mmap else None
+        hashes = np.load(os.path.join(directory, "deletes_hashes.npy"), mmap_mode=mmap_mode)
+        ids = np.load(os.path.join(directory, "deletes_ids.npy"), mmap_mode=mmap_mode)
+        with open(os.path.join(directory, "deletes_words.pkl"), "rb") as f:
+            words = pickle.load(f)
+        return cls(words, word_counts, hashes, ids)
+
+    def most_frequent_within2(self, word: str) -> Optional[str]:
+        """Most frequent vocabulary word exactly reachable by two edits."""
+        sources = defaultdict(list)  # probe key -> edits1 strings producing it
+        for e1 in edits1(word):
+            for key in deletes1(e1) | {e1}:
+                sources[key].append(e1)
+
+        keys = list(sources)
+        probes = np.array([_delete_key(key) for key in keys], dtype=np.int64)
+        lo = np.searchsorted(self.hashes, probes, side="left")
+        hi = np.searchsorted(self.hashes, probes, side="right")
+
+        best, best_count = None, 0
+        for k in np.flatnonzero(hi > lo).tolist():
+            e1s = sources[keys[k]]
+            for word_id in self.ids[lo[k]:hi[k]].tolist():
+                candidate = self.words[word_id]
+                count = self.counts[candidate]
+                if count > best_count and any(one_edit_apart(e1, candidate) for e1 in e1s):
+                    best, best_count = candidate, count
+        return best
+
+
+def _load_deletes_index() -> DeletesIndex:
+    word_counts = registry.get("autocorrect.word_counts")
+    if use_artifacts():
+        return DeletesIndex.load(ARTIFACT_DIR, word_counts, mmap=settings.AUTOCORRECT_MMAP_ARTIFACTS)
+    return DeletesIndex.build(word_counts)
+
+
+registry.register("autocorrect.deletes", _load_deletes_index)
 
 
 def candidates(word):
-    return (
-            known([word]) or
-            known(edits1(word)) or
-            known(e2 for e1 in edits1(word) for e2 in edits1(e1)) or
-            [word]
-    )
+    if word in registry.get("autocorrect.word_counts"):
+        return {word}
+    within1 = known(edits1(word))
+    if within1:
+        return within1
+    within2 = registry.get("autocorrect.deletes").most_frequent_within2(word)
+    return {within2} if within2 else [word]
 
 
+@AUTOCORRECT_SECONDS.timed(function="correct")
+@memoized(LOOKUP_CACHE, "correct")
 def correct(word):
-    return max(candidates(word), key=WORD_COUNTS.get)
+    return max(candidates(word), key=registry.get("autocorrect.word_counts").get)
 
 
 # ------------
@@ -112,15 +507,75 @@ def correct(word):
 # ------------
 
 
-sym_spell = SymSpell(max_dictionary_edit_distance=2)
-sym_spell.load_dictionary("./data/frequency_dictionary_en_82_765.txt", term_index=0, count_index=1)
+def _load_sym_spell() -> SymSpell:
+    sym_spell = SymSpell(max_dictionary_edit_distance=2)
+    if use_artifacts():
+        sym_spell.load_pickle(os.path.join(ARTIFACT_DIR, "symspell.pkl"), compressed=False)
+    else:
+        sym_spell.load_dictionary(SYMSPELL_DICTIONARY_PATH, term_index=0, count_index=1)
+    return sym_spell
+
+
+registry.register("autocorrect.symspell", _load_sym_spell)
 
 
 # Auto-suggest function
+@AUTOCORRECT_SECONDS.timed(function="auto_suggest")
+@memoized(LOOKUP_CACHE, "auto_suggest")
 def auto_suggest(word: str, max_dist: int = 2):
-    suggestions = sym_spell.lookup(
+    suggestions = registry.get("autocorrect.symspell").lookup(
         word,
         Verbosity.CLOSEST,  # You can also use TOP or ALL
         max_edit_distance=max_dist
     )
-    return [s.term for s in suggestions]
\ No newline at end of file
+    return [s.term for s in suggestions]
+
+
+# -----------------------------
+# Batch Correction
+# -----------------------------
+TOKEN_PATTERN = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)*")
+
+
+def tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """Split free text into ``(token, start, end)`` word spans."""
+    return [(m.group(), m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text)]
+
+
+def batch_key(token: str, method: str) -> str:
+    """Key of ``token`` in a ``batch_suggest`` result.
+
+    SymSpell's dictionary is lower-case, so ``"suggest"`` folds case;
+    ``WORD_COUNTS`` is case-sensitive, so ``"correct"`` keeps the token as
+    ``/autocorrect/v1/correct`` receives it.
+    """
+    return token.lower() if method == "suggest" else token
+
+
+def batch_suggest(tokens: Iterable[str], method: str = "suggest", max_dist: int = 2) -> Dict[str, List[str]]:
+    """Look up each distinct token once.
+
+    ``method`` is ``"suggest"`` (SymSpell) or ``"correct"`` (edit-distance
+    model); the result maps every token's ``batch_key`` to its suggestions.
+    """
+    if method == "suggest":
+        lookup = lambda token: auto_suggest(token, max_dist)
+    elif method == "correct":
+        lookup = lambda token: [correct(token)]
+    else:
+        raise ValueError(f"Unknown correction method: {method}")
+    return {token: lookup(token) for token in dict.fromkeys(batch_key(t, method) for t in tokens)}
+
+
+def cache_stats() -> Dict[str, Any]:
+    return LOOKUP_CACHE.stats()
+
+
+def save_artifacts(directory: str):
+    """Write every precompiled lookup structure plus a source manifest."""
+    os.makedirs(directory, exist_ok=True)
+    registry.get("autocorrect.prefix").save(directory)
+    registry.get("autocorrect.deletes").save(directory)
+    registry.get("autocorrect.symspell").save_pickle(os.path.join(directory, "symspell.pkl"), compressed=False)
+    with open(os.path.join(directory, "manifest.json"), "w") as f:
+        json.dump({"fingerprint": source_fingerprint()}, f)
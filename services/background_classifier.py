@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from bson import ObjectId
+from loguru import logger
+from pymongo import UpdateOne
+
+from config import settings
+from services import logistic_classification_service, naive_bayes_classification_service
+from services.classification_executor import ClassificationExecutor, executor
+from services.news_service import classification_text
+
+CLASSIFIERS = {
+    "logistic": logistic_classification_service,
+    "naive_bayes": naive_bayes_classification_service,
+}
+
+# Missing and null categories both match, and the (category, crawledAt) index serves it
+UNCLASSIFIED = {"category": None}
+
+
+class BackgroundClassifier:
+    """Fill in ``category`` for stored articles so listings never classify at read time.
+
+    Unclassified articles are read ``batch_size`` at a time, classified with
+    one vectorized call on the classification executor and written back with
+    a single unordered ``bulk_write``. Once a pass finds nothing left, the
+    loop sleeps for ``interval`` seconds.
+
+    Every worker runs one, so each batch is first claimed with a lease
+    (``classificationLease`` plus its expiry): workers split the backlog
+    instead of classifying the same articles, and a batch held by a worker
+    that died is picked up again once its lease runs out.
+    """
+
+    def __init__(self, collection, service, executor: ClassificationExecutor, batch_size: int = 500,
+                 interval: float = 30, lease: float = 300):
+        self.collection = collection
+        self.service = service
+        self.executor = executor
+        self.batch_size = batch_size
+        self.interval = interval
+        self.lease = timedelta(seconds=lease)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Started background classification with {self.service.MODEL_VERSION}")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def run_once(self) -> int:
+        """Claim and classify one batch; returns the number of articles updated"""
+        articles = await self._claim()
+        if not articles:
+            return 0
+
+        categories = await self.executor.run(
+            self.service.predict_categories, [classification_text(article) for article in articles]
+        )
+        result = await self.collection.bulk_write([
+            UpdateOne(
+                {"_id": article["_id"], **UNCLASSIFIED},
+                {
+                    "$set": {"category": category, "categoryModel": self.service.MODEL_VERSION},
+                    "$unset": {"classificationLease": "", "classificationLeaseUntil": ""}
+                }
+            )
+            for article, category in zip(articles, categories)
+        ], ordered=False)
+        return result.modified_count
+
+    async def _claim(self):
+        """Lease up to ``batch_size`` unclassified articles to this pass and return them"""
+        now = datetime.utcnow()
+        claimable = {
+            **UNCLASSIFIED,
+            "$or": [{"classificationLeaseUntil": None}, {"classificationLeaseUntil": {"$lt": now}}]
+        }
+        candidates = await self.collection.find(claimable, {"_id": 1}).limit(self.batch_size).to_list(
+            length=self.batch_size
+        )
+        if not candidates:
+            return []
+        ids = [article["_id"] for article in candidates]
+        # Each document update is atomic, so a concurrent claim of the same article fails the filter
+        lease = ObjectId()
+        await self.collection.update_many(
+            {"_id": {"$in": ids}, **claimable},
+            {"$set": {"classificationLease": lease, "classificationLeaseUntil": now + self.lease}}
+        )
+        return await self.collection.find(
+            {"_id": {"$in": ids}, "classificationLease": lease}, {"title": 1, "content": 1}
+        ).to_list(length=len(ids))
+
+    async def _run(self):
+        while True:
+            try:
+                classified = 0
+                while True:
+                    updated = await self.run_once()
+                    classified += updated
+                    if updated < self.batch_size:
+                        break
+                if classified:
+                    logger.info(f"Classified {classified} articles")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Background classification failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+def start_background_classifier(collection) -> Optional[BackgroundClassifier]:
+    """Start the classifier configured by BACKGROUND_CLASSIFICATION_MODEL (empty disables it)"""
+    name = settings.BACKGROUND_CLASSIFICATION_MODEL
+    if not name:
+        return None
+    if name not in CLASSIFIERS:
+        raise ValueError(f"Unknown classification model: {name}")
+    classifier = BackgroundClassifier(
+        collection,
+        CLASSIFIERS[name],
+        executor,
+        batch_size=settings.BACKGROUND_CLASSIFICATION_BATCH_SIZE,
+        interval=settings.BACKGROUND_CLASSIFICATION_INTERVAL,
+        lease=settings.BACKGROUND_CLASSIFICATION_LEASE
+    )
+    classifier.start()
+    return classifier
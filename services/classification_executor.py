@@ -0,0 +1,125 @@
+import asyncio
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from loguru import logger
+
+from config import settings
+from services import logistic_classification_service, naive_bayes_classification_service
+
+
+class ClassificationExecutor:
+    """Dedicated worker pool that keeps sklearn inference off the event loop."""
+
+    def __init__(self, kind: str, workers: int):
+        self.kind = kind
+        self.workers = workers
+        self._pool: Optional[Executor] = None
+
+    def start(self):
+        if self._pool is not None:
+            return
+        if self.kind == "process":
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        elif self.kind == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="classify")
+        else:
+            raise ValueError(f"Unknown classification executor: {self.kind}")
+        logger.info(f"Started {self.kind} classification executor with {self.workers} workers")
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, fn: Callable, *args) -> Any:
+        # fn must be a module-level function so process pools can pickle it
+        self.start()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(fn, *args))
+
+
+class MicroBatcher:
+    """Merge single-text predictions arriving within a short window.
+
+    The first request opens a window of ``window_ms``; everything queued
+    before it closes (up to ``max_batch`` texts) goes to ``predict_many`` as
+    one vectorized call on the executor. Collection of the next window
+    continues while earlier batches are still running.
+    """
+
+    def __init__(self, executor: ClassificationExecutor, predict_many: Callable[[List[str]], List[str]],
+                 window_ms: float, max_batch: int):
+        self.executor = executor
+        self.predict_many = predict_many
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, text: str) -> str:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._collect())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            asyncio.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]):
+        try:
+            results = await self.executor.run(self.predict_many, [text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+executor = ClassificationExecutor(settings.CLASSIFICATION_EXECUTOR, settings.CLASSIFICATION_WORKERS)
+
+logistic_batcher = MicroBatcher(
+    executor,
+    logistic_classification_service.predict_categories,
+    settings.CLASSIFICATION_BATCH_WINDOW_MS,
+    settings.CLASSIFICATION_MAX_BATCH_SIZE
+)
+naive_bayes_batcher = MicroBatcher(
+    executor,
+    naive_bayes_classification_service.predict_categories,
+    settings.CLASSIFICATION_BATCH_WINDOW_MS,
+    settings.CLASSIFICATION_MAX_BATCH_SIZE
+)
+
+
+def start_classification_executor():
+    executor.start()
+
+
+async def stop_classification_executor():
+    await logistic_batcher.stop()
+    await naive_bayes_batcher.stop()
+    executor.shutdown()
@@ -1,18 +1,72 @@
+import copy
+
 import joblib
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+from utils import tokenizers  # the pickled vectorizer's tokenizer; registers spaCy
+from utils.metrics import metrics
+from utils.model_registry import registry
+from utils.model_version import model_version
+
+MODEL_PATH = './ai_models/logistic_model.pkl'
+VECTORIZER_PATH = './ai_models/tfidf_vectorizer.pkl'
+LABEL_ENCODER_PATH = './ai_models/label_encoder.pkl'
+
+
+def _pretokenized(tokens: List[str]) -> List[str]:
+    return tokens
+
+
+def _load_model() -> SimpleNamespace:
+    # Load saved model components
+    vectorizer = joblib.load(VECTORIZER_PATH)
+    # Same vocabulary and weights, fed token lists from tokenizers.lemmatize_batch
+    # instead of tokenizing one document at a time
+    batch_vectorizer = copy.copy(vectorizer)
+    batch_vectorizer.set_params(tokenizer=_pretokenized, lowercase=False)
+    return SimpleNamespace(
+        model=joblib.load(MODEL_PATH),
+        vectorizer=vectorizer,
+        batch_vectorizer=batch_vectorizer,
+        label_encoder=joblib.load(LABEL_ENCODER_PATH)
+    )
+
 
-# Load saved model components
-model = joblib.load('./ai_models/logistic_model.pkl')
-vectorizer = joblib.load('./ai_models/tfidf_vectorizer.pkl')
-label_encoder = joblib.load('./ai_models/label_encoder.pkl')
+registry.register("logistic", _load_model)
+
+# Stored next to precomputed categories
+MODEL_VERSION = model_version("logistic", MODEL_PATH, VECTORIZER_PATH, LABEL_ENCODER_PATH)
+
+CLASSIFIER_SECONDS = metrics.histogram(
+    "classifier_seconds", "Classifier time per batch by model and stage (transform, predict)", ["model", "stage"]
+)
 
 
 def predict_category(text: str) -> str:
-    # Transform input text
-    text_vector = vectorizer.transform([text])
+    return predict_categories([text])[0]
+
+
+def predict_categories(texts: List[str]) -> List[str]:
+    return classify(texts)[0]
+
+
+def classify(texts: List[str], include_scores: bool = False) -> Tuple[List[str], Optional[List[Dict[str, float]]]]:
+    """Classify a batch with one sparse transform and one predict call."""
+    components = registry.get("logistic")
+    model, label_encoder = components.model, components.label_encoder
+
+    # Transform input texts; spaCy processes the whole batch through nlp.pipe
+    with CLASSIFIER_SECONDS.time(model="logistic", stage="transform"):
+        text_vectors = components.batch_vectorizer.transform(tokenizers.lemmatize_batch(texts))
 
-    # Predict label
-    pred_label = model.predict(text_vector)[0]
+    with CLASSIFIER_SECONDS.time(model="logistic", stage="predict"):
+        # Predict labels and decode them to category names
+        pred_labels = model.predict(text_vectors)
+        categories = [str(category) for category in label_encoder.inverse_transform(pred_labels)]
 
-    # Decode label to category name
-    category = label_encoder.inverse_transform([pred_label])[0]
-    return category
+        scores = None
+        if include_scores:
+            names = [str(name) for name in label_encoder.inverse_transform(model.classes_)]
+            scores = [dict(zip(names, row.tolist())) for row in model.predict_proba(text_vectors)]
+    return categories, scores
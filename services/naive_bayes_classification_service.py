@@ -1,22 +1,98 @@
 import joblib
-import nltk
+import numpy as np
 import string
-from nltk.corpus import stopwords
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
 
-nltk.download('stop_words')
-stop_words = set(stopwords.words('english'))
+from utils.metrics import metrics
+from utils.model_registry import registry
+from utils.model_version import model_version
 
 
-# Load saved model components
-model = joblib.load('./ai_models/naive_bayes/naive_bayes_model.pkl')
-vectorizer = joblib.load('./ai_models/naive_bayes/tfidf_vectorizer.pkl')
+def _load_stop_words() -> frozenset:
+    # Imported here: nltk pulls in scipy.stats, over a second of import time
+    from nltk.corpus import stopwords
+
+    # Installed at build time (python -m utils.post_install); never downloaded at runtime
+    try:
+        return frozenset(stopwords.words('english'))
+    except LookupError as e:
+        raise RuntimeError("NLTK stopwords corpus is missing; run `python -m utils.post_install`") from e
+
+
+registry.register("nltk.stopwords", _load_stop_words)
+
+
+MODEL_PATH = './ai_models/naive_bayes/naive_bayes_model.pkl'
+VECTORIZER_PATH = './ai_models/naive_bayes/tfidf_vectorizer.pkl'
+
+# Stored next to precomputed categories
+MODEL_VERSION = model_version("naive_bayes", MODEL_PATH, VECTORIZER_PATH)
+
+CLASSIFIER_SECONDS = metrics.histogram(
+    "classifier_seconds", "Classifier time per batch by model and stage (transform, predict)", ["model", "stage"]
+)
+
+
+def _load_model() -> SimpleNamespace:
+    # Load saved model components
+    model = joblib.load(MODEL_PATH)
+    vectorizer = joblib.load(VECTORIZER_PATH)
+
+    # GaussianNB's joint log-likelihood expanded so it only touches non-zero
+    # TF-IDF entries:
+    #   log P(c) - 0.5 * sum(log(2*pi*var)) - 0.5 * sum((x - theta)^2 / var)
+    # = bias[c] - 0.5 * (x^2 @ (1/var)[c]) + x @ (theta/var)[c]
+    inv_var = 1.0 / model.var_
+    return SimpleNamespace(
+        model=model,
+        vectorizer=vectorizer,
+        inv_var=inv_var,
+        theta_over_var=model.theta_ * inv_var,
+        bias=(
+            np.log(model.class_prior_)
+            - 0.5 * np.sum(np.log(2.0 * np.pi * model.var_), axis=1)
+            - 0.5 * np.sum(model.theta_ ** 2 * inv_var, axis=1)
+        )
+    )
+
+
+registry.register("naive_bayes", _load_model)
+
+
+def joint_log_likelihood(X) -> np.ndarray:
+    """Per-class log-likelihood for a sparse TF-IDF matrix, shape (n_texts, n_classes)."""
+    nb = registry.get("naive_bayes")
+    squared = X.multiply(X)
+    return nb.bias - 0.5 * np.asarray(squared @ nb.inv_var.T) + np.asarray(X @ nb.theta_over_var.T)
+
 
 def predict_category(text: str) -> str:
-    text_processed = preprocess(text)  # if you have a preprocessing function
-    X = vectorizer.transform([text_processed])
-    X_dense = X.toarray()  # convert to dense
-    prediction = model.predict(X_dense)
-    return prediction[0]
+    return predict_categories([text])[0]
+
+
+def predict_categories(texts: List[str]) -> List[str]:
+    return classify(texts)[0]
+
+
+def classify(texts: List[str], include_scores: bool = False) -> Tuple[List[str], Optional[List[Dict[str, float]]]]:
+    """Classify a batch with one transform and sparse matrix products."""
+    nb = registry.get("naive_bayes")
+    model = nb.model
+    with CLASSIFIER_SECONDS.time(model="naive_bayes", stage="transform"):
+        X = nb.vectorizer.transform([preprocess(text) for text in texts])
+
+    with CLASSIFIER_SECONDS.time(model="naive_bayes", stage="predict"):
+        jll = joint_log_likelihood(X)
+        categories = [str(category) for category in model.classes_[np.argmax(jll, axis=1)]]
+
+        scores = None
+        if include_scores:
+            names = [str(name) for name in model.classes_]
+            proba = np.exp(jll - jll.max(axis=1, keepdims=True))
+            proba /= proba.sum(axis=1, keepdims=True)
+            scores = [dict(zip(names, row.tolist())) for row in proba]
+    return categories, scores
 
 
 def preprocess(text):
@@ -24,5 +100,6 @@ def preprocess(text):
     text = text.lower()
     text = ''.join(char for char in text if char not in string.punctuation)
     words = text.split()
+    stop_words = registry.get("nltk.stopwords")
     words = [word for word in words if word not in stop_words]
     return ' '.join(words)
@@ -1,10 +1,77 @@
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterable, AsyncIterator, Dict, Any, List, Optional, Tuple, Type, Union
 from bson import ObjectId
-from pymongo import DESCENDING
+from bson.errors import InvalidId
+from pydantic import BaseModel, ValidationError
+from pymongo import DESCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+from functools import lru_cache
+import asyncio
+import base64
+import hashlib
+import json
+import orjson
 import re
 
-from schemas import DateRange, NewsArticle, NewsResponse
+from config import settings
+from schemas import (
+    BulkIngestResponse, DateRange, NewsArticle, NewsArticleCreate, NewsResponse, NewsSummary, NewsSummaryResponse,
+    NewsView, PartialNewsArticle, PartialNewsResponse
+)
+from services import logistic_classification_service
+from services.classification_executor import executor
+from services.search_index import search_index
+from utils.cache import InstrumentedTTLCache
+from utils.metrics import metrics
+
+# Newest first; _id breaks ties so keyset cursors are unambiguous
+LIST_SORT = [("crawledAt", DESCENDING), ("_id", DESCENDING)]
+
+NEWS_SECONDS = metrics.histogram(
+    "news_service_seconds", "NewsService time by operation (count, find, facets, serialize)", ["operation"]
+)
+
+# Filtered totals keyed by normalized filter, shared by all service instances
+COUNT_CACHE = InstrumentedTTLCache(maxsize=1024, ttl=settings.SEARCH_CACHE_TTL)
+# Totals plus per-source/per-day counts from $facet, keyed the same way
+FACETS_CACHE = InstrumentedTTLCache(maxsize=1024, ttl=settings.SEARCH_CACHE_TTL)
+SOURCES_CACHE = InstrumentedTTLCache(maxsize=1, ttl=settings.SEARCH_CACHE_TTL)
+
+
+# Article fields clients may select with a projection; _id is always returned
+ARTICLE_FIELDS = ("title", "content", "sourceUrl", "sourceName", "contentHash", "crawledAt", "category")
+
+# Failures echoed back in a bulk ingestion response
+MAX_INGEST_ERRORS = 20
+
+
+def normalize_source_name(source_name: str) -> str:
+    """Canonical form stored in ``sourceNameLower`` and used for filtering"""
+    return source_name.strip().lower()
+
+
+def normalize_search_query(search_query: str) -> str:
+    """Canonical form of a search term; ``$text`` ignores case and extra whitespace anyway"""
+    return " ".join(search_query.split()).casefold()
+
+
+def classification_text(article: Dict[str, Any]) -> str:
+    """Text an article is classified on"""
+    return f"{article.get('title') or ''}\n{article.get('content') or ''}"
+
+
+async def iter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into non-empty NDJSON lines"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
 
 class NewsService:
     def __init__(self, collection):
@@ -15,9 +82,25 @@ class NewsService:
         page: int = 1,
         page_size: int = 20,
         date_range: Optional[DateRange] = None,
-        source_name: Optional[str] = None
-    ) -> NewsResponse:
-        """Get paginated news articles"""
+        source_name: Optional[str] = None,
+        category: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        view: NewsView = NewsView.FULL,
+        fields: Optional[str] = None,
+        facets: bool = False,
+        as_json: bool = False
+    ) -> Union[NewsResponse, bytes]:
+        """Get paginated news articles.
+
+        With ``cursor`` (a previous response's ``next_cursor``) the page is a
+        range seek on the ``(crawledAt, _id)`` index instead of a skip.
+        ``view``/``fields`` become a MongoDB projection so unused fields are
+        never fetched. ``facets`` fetches the page, total and facet counts
+        in a single ``$facet`` aggregation. ``as_json`` returns the encoded
+        response body instead of a model.
+        """
+        projection = self._build_list_projection(view, fields)
         
         # Build query filters
         query_filter = {}
@@ -27,19 +110,43 @@ class NewsService:
             query_filter.update(date_filter)
         
         if source_name:
-            query_filter["sourceName"] = {"$regex": re.escape(source_name), "$options": "i"}
+            query_filter.update(self._build_source_filter(source_name))
         
-        # Calculate pagination
-        skip = (page - 1) * page_size
+        if category:
+            query_filter["category"] = category
         
-        # Execute queries
-        total = await self.collection.count_documents(query_filter)
-        
-        cursor = self.collection.find(query_filter).sort("crawledAt", DESCENDING).skip(skip).limit(page_size)
-        articles = await cursor.to_list(length=page_size)
+        # Execute queries; with cached facet counts the page takes the indexed path below
+        counts = self._cached_facets(query_filter) if facets else None
+        if facets and counts is None:
+            page_stages = []
+            if cursor:
+                page_stages.append({"$match": self._keyset_filter(self._decode_cursor(cursor), ["crawledAt", "_id"])})
+            page_stages += self._page_stages(dict(LIST_SORT), page, page_size, cursor, projection)
+            articles, counts = await self._find_with_facets(query_filter, page_stages)
+            return self._build_news_response(
+                articles, counts["total"], page, page_size, keyset=bool(cursor), view=view, fields=fields,
+                facets=counts, as_json=as_json
+            )
+        elif cursor:
+            last = self._decode_cursor(cursor)
+            page_filter = {"$and": [query_filter, self._keyset_filter(last, ["crawledAt", "_id"])]}
+            find_cursor = self.collection.find(page_filter, projection).sort(LIST_SORT).limit(page_size + 1)
+        else:
+            skip = (page - 1) * page_size
+            find_cursor = self.collection.find(query_filter, projection).sort(LIST_SORT).skip(skip).limit(page_size + 1)
+        if counts is not None:
+            total, articles = counts["total"], await self._fetch(find_cursor, page_size + 1)
+        else:
+            total, articles = await asyncio.gather(
+                self._count(query_filter, include_total),
+                self._fetch(find_cursor, page_size + 1)
+            )
         
         # Convert to response model
-        return self._build_news_response(articles, total, page, page_size)
+        return self._build_news_response(
+            articles, total, page, page_size, keyset=bool(cursor), view=view, fields=fields, facets=counts,
+            as_json=as_json
+        )
     
     async def search_news(
         self,
@@ -47,9 +154,32 @@ class NewsService:
         page: int = 1,
         page_size: int = 20,
         date_range: Optional[DateRange] = None,
-        source_name: Optional[str] = None
-    ) -> NewsResponse:
-        """Search news articles by text"""
+        source_name: Optional[str] = None,
+        category: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        view: NewsView = NewsView.FULL,
+        fields: Optional[str] = None,
+        facets: bool = False,
+        as_json: bool = False
+    ) -> Union[NewsResponse, bytes]:
+        """Search news articles by text.
+
+        With ``cursor`` the page continues after the last ``(score,
+        crawledAt, _id)`` seen, via an aggregation instead of a skip.
+        ``facets`` and ``as_json`` behave as in ``get_news_paginated``.
+        With ``SEARCH_BACKEND=local`` the in-process BM25 index ranks and
+        filters instead, once its first build has finished.
+        """
+        projection = self._build_list_projection(view, fields)
+        # One spelling per query, so the count and facet caches are shared
+        search_query = normalize_search_query(search_query)
+        
+        if settings.SEARCH_BACKEND == "local" and search_index.ready:
+            return await self._search_local(
+                search_query, page, page_size, date_range, source_name, category, cursor, include_total, view,
+                fields, projection, facets, as_json
+            )
         
         # Build query filters
         query_filter = {"$text": {"$search": search_query}}
@@ -59,22 +189,186 @@ class NewsService:
             query_filter.update(date_filter)
         
         if source_name:
-            query_filter["sourceName"] = {"$regex": re.escape(source_name), "$options": "i"}
+            query_filter.update(self._build_source_filter(source_name))
         
-        # Calculate pagination
-        skip = (page - 1) * page_size
+        if category:
+            query_filter["category"] = category
         
         # Execute search with text score
-        total = await self.collection.count_documents(query_filter)
+        search_sort = {"score": DESCENDING, "crawledAt": DESCENDING, "_id": DESCENDING}
+        counts = self._cached_facets(query_filter) if facets else None
+        if facets and counts is None:
+            page_stages = []
+            if cursor:
+                page_stages.append({"$match": self._keyset_filter(self._decode_cursor(cursor), ["score", "crawledAt", "_id"])})
+            page_stages += self._page_stages(
+                search_sort, page, page_size, cursor, {**projection, "score": 1} if projection else None
+            )
+            articles, counts = await self._find_with_facets(query_filter, page_stages, text_score=True)
+            return self._build_news_response(
+                articles, counts["total"], page, page_size, keyset=bool(cursor), view=view, fields=fields,
+                facets=counts, as_json=as_json
+            )
+        elif cursor:
+            last = self._decode_cursor(cursor)
+            find_cursor = self.collection.aggregate([
+                {"$match": query_filter},
+                {"$addFields": {"score": {"$meta": "textScore"}}},
+                {"$match": self._keyset_filter(last, ["score", "crawledAt", "_id"])},
+                {"$sort": search_sort},
+                {"$limit": page_size + 1}
+            ] + ([{"$project": {**projection, "score": 1}}] if projection else []))
+        else:
+            skip = (page - 1) * page_size
+            find_cursor = self.collection.find(
+                query_filter,
+                {**(projection or {}), "score": {"$meta": "textScore"}}
+            ).sort([("score", {"$meta": "textScore"})] + LIST_SORT).skip(skip).limit(page_size + 1)
+        
+        if counts is not None:
+            total, articles = counts["total"], await self._fetch(find_cursor, page_size + 1)
+        else:
+            total, articles = await asyncio.gather(
+                self._count(query_filter, include_total),
+                self._fetch(find_cursor, page_size + 1)
+            )
         
-        cursor = self.collection.find(
-            query_filter,
-            {"score": {"$meta": "textScore"}}
-        ).sort([("score", {"$meta": "textScore"}), ("crawledAt", DESCENDING)]).skip(skip).limit(page_size)
+        return self._build_news_response(
+            articles, total, page, page_size, keyset=bool(cursor), view=view, fields=fields, facets=counts,
+            as_json=as_json
+        )
+    
+    async def _search_local(
+        self,
+        search_query: str,
+        page: int,
+        page_size: int,
+        date_range: Optional[DateRange],
+        source_name: Optional[str],
+        category: Optional[str],
+        cursor: Optional[str],
+        include_total: bool,
+        view: NewsView,
+        fields: Optional[str],
+        projection: Optional[Dict[str, Any]],
+        facets: bool,
+        as_json: bool
+    ) -> Union[NewsResponse, bytes]:
+        """``search_news`` ranked by the BM25 index; MongoDB only serves the page by ``_id``"""
+        last = self._decode_cursor(cursor) if cursor else None
+        if last is not None and "score" not in last:
+            raise ValueError("Cursor does not carry score")
+        crawled_range = self._build_date_filter(date_range).get("crawledAt", {}) if date_range else {}
         
-        articles = await cursor.to_list(length=page_size)
+        with NEWS_SECONDS.time(operation="bm25"):
+            result = search_index.search(
+                search_query,
+                start=crawled_range.get("$gte"),
+                end=crawled_range.get("$lte"),
+                source_prefix=normalize_source_name(source_name) if source_name else None,
+                category=category,
+                offset=0 if cursor else (page - 1) * page_size,
+                limit=page_size + 1,
+                after=last,
+                facets=facets
+            )
         
-        return self._build_news_response(articles, total, page, page_size)
+        articles = []
+        if result.hits:
+            ids = [doc_id for doc_id, _ in result.hits]
+            found = {
+                article["_id"]: article
+                for article in await self._fetch(self.collection.find({"_id": {"$in": ids}}, projection), len(ids))
+            }
+            # Keep the index's order; articles deleted since indexing are skipped
+            for doc_id, score in result.hits:
+                if doc_id in found:
+                    articles.append({**found[doc_id], "score": score})
+        
+        return self._build_news_response(
+            articles, result.total if include_total or facets else None, page, page_size, keyset=bool(cursor),
+            view=view, fields=fields, facets=result.facets, as_json=as_json
+        )
+    
+    async def bulk_ingest(self, items: AsyncIterable[Any], classify: bool = False) -> BulkIngestResponse:
+        """Insert articles in unordered ``bulk_write`` batches, skipping known ``contentHash`` values.
+
+        ``items`` are article dicts or raw NDJSON lines. Each batch of
+        INGEST_BATCH_SIZE articles is optionally classified with one
+        vectorized logistic-model call before it is written.
+        """
+        report = BulkIngestResponse(received=0, inserted=0, duplicates=0, failed=0)
+        batch: List[Dict[str, Any]] = []
+        async for item in items:
+            report.received += 1
+            try:
+                if isinstance(item, (bytes, str)):
+                    item = orjson.loads(item)
+                article = NewsArticleCreate.model_validate(item)
+            except orjson.JSONDecodeError as e:
+                self._record_ingest_error(report, report.received, f"invalid JSON: {e}")
+                continue
+            except ValidationError as e:
+                reason = "; ".join(f"{'.'.join(map(str, err['loc'])) or 'item'}: {err['msg']}" for err in e.errors())
+                self._record_ingest_error(report, report.received, reason)
+                continue
+            doc = article.model_dump()
+            doc["contentHash"] = doc["contentHash"] or hashlib.sha256(doc["content"].encode()).hexdigest()
+            doc["crawledAt"] = doc["crawledAt"] or datetime.utcnow()
+            doc["sourceNameLower"] = normalize_source_name(doc["sourceName"])
+            batch.append(doc)
+            if len(batch) >= settings.INGEST_BATCH_SIZE:
+                await self._write_batch(batch, classify, report)
+                batch = []
+        if batch:
+            await self._write_batch(batch, classify, report)
+        return report
+    
+    async def _write_batch(self, batch: List[Dict[str, Any]], classify: bool, report: BulkIngestResponse):
+        """Upsert one batch keyed on contentHash; existing hashes count as duplicates"""
+        unique = {}
+        for doc in batch:
+            unique.setdefault(doc["contentHash"], doc)
+        report.duplicates += len(batch) - len(unique)
+        docs = list(unique.values())
+        
+        if classify:
+            # Only new stories are classified; an article can still win the
+            # upsert race in between, which just wastes its prediction
+            existing = await self.collection.distinct("contentHash", {"contentHash": {"$in": list(unique)}})
+            report.duplicates += len(existing)
+            existing = set(existing)
+            docs = [doc for doc in docs if doc["contentHash"] not in existing]
+            if not docs:
+                return
+            categories = await executor.run(
+                logistic_classification_service.predict_categories, [classification_text(doc) for doc in docs]
+            )
+            for doc, category in zip(docs, categories):
+                doc["category"] = category
+                doc["categoryModel"] = logistic_classification_service.MODEL_VERSION
+        
+        operations = [UpdateOne({"contentHash": doc["contentHash"]}, {"$setOnInsert": doc}, upsert=True) for doc in docs]
+        try:
+            result = await self.collection.bulk_write(operations, ordered=False)
+            report.inserted += result.upserted_count
+            report.duplicates += result.matched_count
+        except BulkWriteError as e:
+            details = e.details
+            report.inserted += details.get("nUpserted", 0)
+            report.duplicates += details.get("nMatched", 0)
+            for error in details.get("writeErrors", []):
+                # Concurrent ingestion of the same story loses the upsert race
+                if error.get("code") == 11000:
+                    report.duplicates += 1
+                else:
+                    self._record_ingest_error(report, None, error.get("errmsg", "write failed"))
+    
+    @staticmethod
+    def _record_ingest_error(report: BulkIngestResponse, item: Optional[int], message: str):
+        report.failed += 1
+        if len(report.errors) < MAX_INGEST_ERRORS:
+            report.errors.append(f"item {item}: {message}" if item is not None else message)
     
     async def get_news_by_id(self, article_id: str) -> Optional[NewsArticle]:
         """Get a specific news article by ID"""
@@ -95,6 +389,192 @@ class NewsService:
         
         return [NewsArticle(**self._convert_object_id(article)) for article in articles]
     
+    async def stream_news_by_date_range(
+        self,
+        date_range: DateRange,
+        projection: Optional[Dict[str, int]] = None,
+        array: bool = False,
+        batch_size: int = 500
+    ) -> AsyncIterator[bytes]:
+        """Stream articles for a date range as NDJSON lines (or one JSON array).
+
+        The Motor cursor is consumed batch by batch, so memory stays bounded
+        by ``batch_size`` however many articles fall in the range.
+        """
+        date_filter = self._build_date_filter(date_range)
+        cursor = self.collection.find(date_filter, projection).sort("crawledAt", DESCENDING).batch_size(batch_size)
+        
+        separator = b"," if array else b"\n"
+        first = True
+        if array:
+            yield b"["
+        async for article in cursor:
+            line = json.dumps(self._convert_object_id(article), default=self._json_default).encode()
+            if array:
+                yield line if first else separator + line
+            else:
+                yield line + separator
+            first = False
+        if array:
+            yield b"]"
+    
+    @staticmethod
+    def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+        """Sorted, de-duplicated fields of a comma-separated list; raises ValueError on unknown fields"""
+        if not fields:
+            return None
+        selected = {field.strip() for field in fields.split(",") if field.strip()}
+        unknown = sorted(selected - set(ARTICLE_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return tuple(sorted(selected)) or None
+    
+    def build_projection(self, fields: Optional[str]) -> Optional[Dict[str, int]]:
+        """MongoDB projection for a comma-separated field list; raises ValueError on unknown fields"""
+        selected = self.parse_fields(fields)
+        if not selected:
+            return None
+        return {field: 1 for field in selected}
+    
+    def _build_list_projection(self, view: NewsView, fields: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Projection for listing views; crawledAt is always kept for cursors"""
+        if view == NewsView.SUMMARY:
+            if fields:
+                raise ValueError("fields cannot be combined with view=summary")
+            return {
+                "title": 1,
+                "sourceUrl": 1,
+                "sourceName": 1,
+                "crawledAt": 1,
+                "category": 1,
+                "snippet": {"$substrCP": ["$content", 0, settings.SUMMARY_SNIPPET_LENGTH]}
+            }
+        projection = self.build_projection(fields)
+        if projection:
+            projection["crawledAt"] = 1
+        return projection
+    
+    @staticmethod
+    def _json_default(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, ObjectId):
+            return str(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    
+    async def get_sources(self) -> List[str]:
+        """Distinct source names, cached for SEARCH_CACHE_TTL"""
+        sources = SOURCES_CACHE.get("sources")
+        if sources is not None:
+            SOURCES_CACHE.hits += 1
+            return sources
+        SOURCES_CACHE.misses += 1
+        sources = sorted(name for name in await self.collection.distinct("sourceName") if name)
+        SOURCES_CACHE["sources"] = sources
+        return sources
+    
+    async def latest_crawled_at(self) -> Optional[datetime]:
+        """Newest crawl timestamp, read from the crawledAt index"""
+        latest = await self.collection.find_one({}, {"crawledAt": 1}, sort=[("crawledAt", DESCENDING)])
+        return latest["crawledAt"] if latest else None
+    
+    def _page_stages(
+        self,
+        sort: Dict[str, int],
+        page: int,
+        page_size: int,
+        cursor: Optional[str],
+        projection: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Sort/skip/limit/project stages selecting one page (plus one look-ahead)"""
+        stages = [{"$sort": sort}]
+        if not cursor and page > 1:
+            stages.append({"$skip": (page - 1) * page_size})
+        stages.append({"$limit": page_size + 1})
+        if projection:
+            stages.append({"$project": projection})
+        return stages
+    
+    @NEWS_SECONDS.timed(operation="find")
+    async def _fetch(self, find_cursor, length: int) -> List[Dict[str, Any]]:
+        return await find_cursor.to_list(length=length)
+    
+    @NEWS_SECONDS.timed(operation="facets")
+    async def _find_with_facets(
+        self,
+        query_filter: Dict[str, Any],
+        page_stages: List[Dict[str, Any]],
+        text_score: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Page, total and per-source/per-day counts from one ``$facet`` aggregation.
+
+        Counts are cached per filter for SEARCH_CACHE_TTL. ``$facet``
+        branches cannot use indexes, so callers only come here on a miss
+        (see ``_cached_facets``) and fetch pages with a plain query otherwise.
+        """
+        branches = {
+            "articles": page_stages,
+            "total": [{"$count": "count"}],
+            "sources": [
+                {"$group": {"_id": "$sourceName", "count": {"$sum": 1}}},
+                {"$sort": {"count": DESCENDING, "_id": 1}}
+            ],
+            "days": [
+                {"$group": {
+                    "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$crawledAt"}},
+                    "count": {"$sum": 1}
+                }},
+                {"$sort": {"_id": DESCENDING}}
+            ]
+        }
+        
+        pipeline = [{"$match": query_filter}]
+        if text_score:
+            pipeline.append({"$addFields": {"score": {"$meta": "textScore"}}})
+        pipeline.append({"$facet": branches})
+        result = (await self.collection.aggregate(pipeline).to_list(length=1))[0]
+        
+        counts = {
+            "total": result["total"][0]["count"] if result["total"] else 0,
+            "sources": [{"value": b["_id"], "count": b["count"]} for b in result["sources"] if b["_id"]],
+            "days": [{"value": b["_id"], "count": b["count"]} for b in result["days"] if b["_id"]]
+        }
+        key = json.dumps(query_filter, sort_keys=True, default=str)
+        FACETS_CACHE[key] = counts
+        COUNT_CACHE[key] = counts["total"]
+        return result["articles"], counts
+    
+    def _cached_facets(self, query_filter: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Facet counts for a filter if still cached"""
+        counts = FACETS_CACHE.get(json.dumps(query_filter, sort_keys=True, default=str))
+        if counts is not None:
+            FACETS_CACHE.hits += 1
+        else:
+            FACETS_CACHE.misses += 1
+        return counts
+    
+    @NEWS_SECONDS.timed(operation="count")
+    async def _count(self, query_filter: Dict[str, Any], include_total: bool = True) -> Optional[int]:
+        """Total for a listing: estimated when unfiltered, otherwise cached per filter"""
+        if not include_total:
+            return None
+        if not query_filter:
+            return await self.collection.estimated_document_count()
+        
+        key = json.dumps(query_filter, sort_keys=True, default=str)
+        total = COUNT_CACHE.get(key)
+        if total is not None:
+            COUNT_CACHE.hits += 1
+            return total
+        COUNT_CACHE.misses += 1
+        total = await self.collection.count_documents(query_filter)
+        COUNT_CACHE[key] = total
+        return total
+    
+    def _build_source_filter(self, source_name: str) -> Dict[str, Any]:
+        """Case-insensitive source prefix match served by the (sourceNameLower, crawledAt) index"""
+        return {"sourceNameLower": {"$regex": "^" + re.escape(normalize_source_name(source_name))}}
+    
     def _build_date_filter(self, date_range: DateRange) -> Dict[str, Any]:
         """Build MongoDB date filter based on date range"""
         now = datetime.utcnow()
@@ -119,28 +599,107 @@ class NewsService:
             }
         }
     
+    def _encode_cursor(self, article: Dict[str, Any]) -> str:
+        """Opaque cursor for the sort key of the last article on a page"""
+        key = {"c": article["crawledAt"].isoformat(), "i": str(article["_id"])}
+        if "score" in article:
+            key["s"] = article["score"]
+        return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+    
+    def _decode_cursor(self, cursor: str) -> Dict[str, Any]:
+        """Decode a cursor into its sort key values; raises ValueError if malformed"""
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            last = {"crawledAt": datetime.fromisoformat(key["c"]), "_id": ObjectId(key["i"])}
+            if "s" in key:
+                last["score"] = float(key["s"])
+            return last
+        except (ValueError, KeyError, TypeError, InvalidId) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+    
+    def _keyset_filter(self, last: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+        """Match documents strictly after ``last`` in descending ``fields`` order"""
+        missing = [field for field in fields if field not in last]
+        if missing:
+            raise ValueError(f"Cursor does not carry {', '.join(missing)}")
+        clauses = []
+        for i, field in enumerate(fields):
+            clause = {prior: last[prior] for prior in fields[:i]}
+            clause[field] = {"$lt": last[field]}
+            clauses.append(clause)
+        return {"$or": clauses}
+    
     def _convert_object_id(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """Convert MongoDB ObjectId to string"""
         if "_id" in article:
             article["_id"] = str(article["_id"])
         return article
     
+    @NEWS_SECONDS.timed(operation="serialize")
     def _build_news_response(
         self,
         articles: List[Dict[str, Any]],
-        total: int,
+        total: Optional[int],
         page: int,
-        page_size: int
-    ) -> NewsResponse:
-        """Build paginated news response"""
-        total_pages = (total + page_size - 1) // page_size
+        page_size: int,
+        keyset: bool = False,
+        view: NewsView = NewsView.FULL,
+        fields: Optional[str] = None,
+        facets: Optional[Dict[str, Any]] = None,
+        as_json: bool = False
+    ) -> Union[NewsResponse, bytes]:
+        """Build paginated news response from up to ``page_size + 1`` articles.
+
+        With ``as_json`` the raw documents are encoded straight to JSON bytes
+        by orjson, skipping per-article pydantic validation; the bytes match
+        ``model_dump_json(by_alias=True, exclude_unset=True)``. Under
+        ``DEBUG`` the response is validated through the models first.
+        """
+        if view == NewsView.SUMMARY:
+            response_model, article_model = NewsSummaryResponse, NewsSummary
+        elif fields:
+            response_model, article_model = PartialNewsResponse, PartialNewsArticle
+        else:
+            response_model, article_model = NewsResponse, NewsArticle
+        total_pages = (total + page_size - 1) // page_size if total is not None else None
+        has_next = len(articles) > page_size
+        articles = articles[:page_size]
+        next_cursor = self._encode_cursor(articles[-1]) if has_next else None
+        
+        # Only carry facets when requested, so unset it stays out of the body
+        extra = {"facets": {"sources": facets["sources"], "days": facets["days"]}} if facets else {}
+        if as_json and not settings.DEBUG:
+            output_fields = _output_fields(article_model)
+            return orjson.dumps({
+                "articles": [
+                    {key: article[key] for key in output_fields if key in article}
+                    for article in articles
+                ],
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "total_pages": total_pages,
+                "has_next": has_next,
+                "has_previous": keyset or page > 1,
+                "next_cursor": next_cursor,
+                **extra
+            }, default=self._json_default)
         
-        return NewsResponse(
-            articles=[NewsArticle(**self._convert_object_id(article)) for article in articles],
+        response = response_model(
+            articles=[article_model(**self._convert_object_id(article)) for article in articles],
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
-            has_next=page < total_pages,
-            has_previous=page > 1
+            has_next=has_next,
+            has_previous=keyset or page > 1,
+            next_cursor=next_cursor,
+            **extra
         )
+        return response.model_dump_json(by_alias=True, exclude_unset=True).encode() if as_json else response
+
+
+@lru_cache(maxsize=None)
+def _output_fields(article_model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Serialized names of an article model's fields, in field order; aliases equal the document keys"""
+    return tuple(field.alias or name for name, field in article_model.model_fields.items())
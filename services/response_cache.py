@@ -0,0 +1,129 @@
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+from config import settings
+from utils.cache import InstrumentedTTLCache
+
+
+class ResponseCache:
+    """Two-tier cache of serialized JSON responses.
+
+    An in-process TTL/LRU sits in front of Redis (any client exposing async
+    ``get``/``set``, e.g. ``redis.asyncio`` or ``fakeredis.aioredis``). Values
+    are the final response bytes, so hits skip MongoDB, pydantic and JSON
+    encoding. Concurrent misses for one key share a single computation.
+
+    Keys embed a freshness token -- the newest ``crawledAt`` in the
+    collection, re-read at most every ``freshness_interval`` seconds -- so
+    a new crawl moves every listing to fresh keys and stale entries simply
+    age out.
+    """
+
+    def __init__(self, redis_client=None, local_size: int = 1024, ttl: int = 300,
+                 freshness_interval: float = 30, namespace: str = "news:v1"):
+        self.redis = redis_client
+        self.local = InstrumentedTTLCache(maxsize=local_size, ttl=ttl)
+        self.ttl = ttl
+        self.freshness_interval = freshness_interval
+        self.namespace = namespace
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._freshness: Optional[str] = None
+        self._freshness_checked = 0.0
+
+    def make_key(self, **parts: Any) -> str:
+        normalized = json.dumps(parts, sort_keys=True, default=str)
+        return f"{self.namespace}:{hashlib.sha1(normalized.encode()).hexdigest()}"
+
+    async def freshness(self, probe: Callable[[], Awaitable[Any]]) -> str:
+        now = time.monotonic()
+        if self._freshness is None or now - self._freshness_checked > self.freshness_interval:
+            self._freshness = str(await probe())
+            self._freshness_checked = now
+        return self._freshness
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[bytes]]) -> bytes:
+        value = self.local.get(key)
+        if value is not None:
+            self.local.hits += 1
+            return value
+        self.local.misses += 1
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leading request was cancelled mid-computation; take over
+                return await self.get_or_compute(key, compute)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._redis_get(key)
+            if value is None:
+                value = await compute()
+                await self._redis_set(key, value)
+            self.local[key] = value
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve it so waiters-less failures are not reported as unhandled
+            future.exception()
+            raise
+        finally:
+            # Cancellation (a BaseException) skips the handler above; never leave waiters hanging
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+
+    async def _redis_get(self, key: str) -> Optional[bytes]:
+        if self.redis is None:
+            return None
+        try:
+            return await self.redis.get(key)
+        except Exception as e:
+            logger.warning(f"Redis get failed, falling back to MongoDB: {e}")
+            return None
+
+    async def _redis_set(self, key: str, value: bytes):
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(key, value, ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Redis set failed: {e}")
+
+    async def close(self):
+        if self.redis is not None:
+            await self.redis.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.local.stats(), "redis": self.redis is not None}
+
+
+def _connect_redis():
+    if not settings.REDIS_URL:
+        return None
+    import redis.asyncio as redis
+    return redis.from_url(settings.REDIS_URL)
+
+
+response_cache = ResponseCache(
+    redis_client=_connect_redis(),
+    local_size=settings.RESPONSE_CACHE_LOCAL_SIZE,
+    ttl=settings.SEARCH_CACHE_TTL,
+    freshness_interval=settings.RESPONSE_CACHE_FRESHNESS_INTERVAL
+)
+
+
+def get_response_cache() -> ResponseCache:
+    """Get response cache instance - used for dependency injection"""
+    return response_cache
@@ -0,0 +1,566 @@
+import asyncio
+import heapq
+import math
+import os
+import pickle
+import re
+import time
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from bson import ObjectId
+from loguru import logger
+from pymongo import ASCENDING
+
+from config import settings
+from utils.metrics import metrics
+
+# Field boosts applied to term frequencies; changing them invalidates snapshots
+FIELD_WEIGHTS = {"title": 2, "content": 1, "sourceName": 1}
+INDEXED_FIELDS = {"title": 1, "content": 1, "sourceName": 1, "sourceNameLower": 1, "crawledAt": 1, "category": 1}
+
+# Bumped whenever tokenization or the snapshot layout changes
+SNAPSHOT_FORMAT = 1
+
+EPOCH = datetime(1970, 1, 1)
+DAY_MICROS = 86400 * 1000000
+_TOKEN = re.compile(r"[^\W_]+")
+
+INDEX_DOCUMENTS = metrics.gauge("search_index_documents", "Articles in the in-process BM25 index")
+
+
+@lru_cache(maxsize=None)
+def _stemmer() -> Tuple[Callable[[str], str], frozenset]:
+    # nltk and sklearn take ~1s to import; only the local search backend needs them
+    from nltk.stem.snowball import SnowballStemmer
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+    return SnowballStemmer("english").stem, ENGLISH_STOP_WORDS
+
+
+@lru_cache(maxsize=200000)
+def _stem(word: str) -> Optional[str]:
+    stem, stop_words = _stemmer()
+    if word in stop_words:
+        return None
+    return stem(word)
+
+
+def analyze(text: str) -> List[str]:
+    """Lowercased, stemmed terms without stop words, like MongoDB's English text index"""
+    terms = []
+    for word in _TOKEN.findall(text.lower()):
+        term = _stem(word)
+        if term:
+            terms.append(term)
+    return terms
+
+
+def analyze_query(query: str) -> Tuple[List[str], List[str]]:
+    """Terms to match and ``-negated`` terms to exclude; quoted phrases match as plain terms.
+
+    As in ``$text``, only a hyphen starting a whitespace-separated word negates
+    it; ``covid-19`` searches for both parts.
+    """
+    include, exclude = [], []
+    for word in query.split():
+        target = exclude if word.startswith("-") else include
+        for term in analyze(word):
+            if term not in target:
+                target.append(term)
+    return include, exclude
+
+
+def analyze_document(doc: Dict[str, Any]) -> Tuple[Counter, int]:
+    """Weighted term frequencies and weighted length of an article"""
+    terms = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        for term in analyze(doc.get(field) or ""):
+            terms[term] += weight
+    return terms, sum(terms.values())
+
+
+def to_micros(value: Optional[datetime]) -> int:
+    """Microseconds since the epoch; naive datetimes are UTC, as motor returns them"""
+    if value is None:
+        return 0
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+class Postings:
+    """Documents containing one term: delta-encoded document numbers and term frequencies."""
+
+    __slots__ = ("last", "deltas", "tfs")
+
+    def __init__(self):
+        self.last = 0
+        self.deltas = array("I")
+        self.tfs = array("H")
+
+    def append(self, docno: int, tf: int):
+        # Document numbers only grow, so deltas stay small and non-negative
+        self.deltas.append(docno - self.last)
+        self.tfs.append(min(tf, 65535))
+        self.last = docno
+
+    def decode(self) -> Tuple[np.ndarray, np.ndarray]:
+        return (np.frombuffer(self.deltas, dtype=np.uint32).cumsum(dtype=np.int64),
+                np.frombuffer(self.tfs, dtype=np.uint16).astype(np.float64))
+
+
+class SearchResult(NamedTuple):
+    hits: List[Tuple[ObjectId, float]]
+    total: int
+    facets: Optional[Dict[str, Any]]
+
+
+class BM25Index:
+    """Append-only in-memory inverted index over title, content and sourceName.
+
+    Articles get consecutive document numbers; per-document columns
+    (``_id``, ``crawledAt``, length, source, category) are flat arrays so a
+    query scores every posting list with numpy and applies the date,
+    source and category filters as boolean masks over all documents. The
+    page is then selected with a partial sort plus a top-k heap over
+    ``(score, crawledAt, _id)``, the order the MongoDB backend uses.
+
+    Not thread-safe: updates and queries both run on the event loop.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.ready = False
+        self._reset()
+
+    def _reset(self):
+        self.watermark: Optional[datetime] = None
+        self._ids = bytearray()  # 12-byte ObjectIds, one per document number
+        self._crawled = array("q")
+        self._lengths = array("I")
+        self._sources = array("I")
+        self._categories = array("i")  # -1 while unclassified
+        self._total_length = 0
+        self._postings: Dict[str, Postings] = {}
+        self._source_names: List[str] = []
+        self._source_lower: List[str] = []
+        self._category_names: List[str] = []
+        self._rebuild_lookups()
+
+    def _rebuild_lookups(self):
+        self._docnos = {bytes(self._ids[i:i + 12]): i // 12 for i in range(0, len(self._ids), 12)}
+        self._source_ids = {name: i for i, name in enumerate(self._source_names)}
+        self._category_ids = {name: i for i, name in enumerate(self._category_names)}
+
+    def __len__(self) -> int:
+        return len(self._crawled)
+
+    def __contains__(self, doc_id: ObjectId) -> bool:
+        return doc_id.binary in self._docnos
+
+    def _category_id(self, category: Optional[str]) -> int:
+        if not category:
+            return -1
+        if category not in self._category_ids:
+            self._category_ids[category] = len(self._category_names)
+            self._category_names.append(category)
+        return self._category_ids[category]
+
+    def add(self, doc: Dict[str, Any], terms: Counter, length: int) -> bool:
+        """Index an analyzed article; returns False if its ``_id`` is already indexed"""
+        key = doc["_id"].binary
+        if key in self._docnos:
+            return False
+        docno = len(self)
+        source_name = doc.get("sourceName") or ""
+        if source_name not in self._source_ids:
+            self._source_ids[source_name] = len(self._source_names)
+            self._source_names.append(source_name)
+            self._source_lower.append(doc.get("sourceNameLower") or source_name.strip().lower())
+
+        self._docnos[key] = docno
+        self._ids += key
+        self._crawled.append(to_micros(doc.get("crawledAt")))
+        self._lengths.append(length)
+        self._sources.append(self._source_ids[source_name])
+        self._categories.append(self._category_id(doc.get("category")))
+        self._total_length += length
+        for term, tf in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = Postings()
+            postings.append(docno, tf)
+
+        crawled_at = doc.get("crawledAt")
+        if crawled_at is not None and (self.watermark is None or crawled_at > self.watermark):
+            self.watermark = crawled_at
+        return True
+
+    def doc_id(self, docno: int) -> ObjectId:
+        return ObjectId(bytes(self._ids[12 * docno:12 * docno + 12]))
+
+    def unclassified(self) -> np.ndarray:
+        """Document numbers still lacking a category"""
+        return np.flatnonzero(np.frombuffer(self._categories, dtype=np.int32) < 0)
+
+    def set_category(self, doc_id: ObjectId, category: str):
+        docno = self._docnos.get(doc_id.binary)
+        if docno is not None:
+            self._categories[docno] = self._category_id(category)
+
+    def _filter_mask(self, start: Optional[datetime], end: Optional[datetime], source_prefix: Optional[str],
+                     category: Optional[str]) -> Optional[np.ndarray]:
+        mask = None
+
+        def narrow(condition: np.ndarray):
+            nonlocal mask
+            mask = condition if mask is None else mask & condition
+
+        crawled = np.frombuffer(self._crawled, dtype=np.int64)
+        if start is not None:
+            narrow(crawled >= to_micros(start))
+        if end is not None:
+            narrow(crawled <= to_micros(end))
+        if source_prefix is not None:
+            matching = [i for i, name in enumerate(self._source_lower) if name.startswith(source_prefix)]
+            narrow(np.isin(np.frombuffer(self._sources, dtype=np.uint32), matching))
+        if category is not None:
+            category_id = self._category_ids.get(category, -2)
+            narrow(np.frombuffer(self._categories, dtype=np.int32) == category_id)
+        return mask
+
+    def search(
+        self,
+        query: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        source_prefix: Optional[str] = None,
+        category: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 20,
+        after: Optional[Dict[str, Any]] = None,
+        facets: bool = False
+    ) -> SearchResult:
+        """Best ``limit`` matches after skipping ``offset``, or strictly after the ``after`` sort key.
+
+        Terms are OR'ed as in a ``$text`` search; ``-term`` excludes
+        articles. ``total`` and ``facets`` cover every match, ignoring
+        ``offset``/``after``.
+        """
+        include, exclude = analyze_query(query)
+        n = len(self)
+        empty_facets = {"total": 0, "sources": [], "days": []} if facets else None
+        if not include or not n:
+            return SearchResult([], 0, empty_facets)
+
+        lengths = np.frombuffer(self._lengths, dtype=np.uint32)
+        k1, b, avgdl = self.k1, self.b, self._total_length / n
+        scores = np.zeros(n)
+        for term in include:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            docnos, tfs = postings.decode()
+            idf = math.log(1 + (n - len(docnos) + 0.5) / (len(docnos) + 0.5))
+            scores[docnos] += idf * tfs * (k1 + 1) / (tfs + k1 * (1 - b + b * lengths[docnos] / avgdl))
+
+        matched = scores > 0
+        for term in exclude:
+            postings = self._postings.get(term)
+            if postings is not None:
+                matched[postings.decode()[0]] = False
+        mask = self._filter_mask(start, end, source_prefix, category)
+        if mask is not None:
+            matched &= mask
+        candidates = np.flatnonzero(matched)
+        crawled = np.frombuffer(self._crawled, dtype=np.int64)
+
+        counts = None
+        if facets:
+            counts = {"total": len(candidates), "sources": self._source_facet(candidates),
+                      "days": self._day_facet(crawled[candidates])}
+
+        hits = self._top(candidates, scores, crawled, offset, limit, after)
+        return SearchResult(hits, len(candidates), counts)
+
+    def _top(self, candidates: np.ndarray, scores: np.ndarray, crawled: np.ndarray, offset: int, limit: int,
+             after: Optional[Dict[str, Any]]) -> List[Tuple[ObjectId, float]]:
+        candidate_scores = scores[candidates]
+        candidate_crawled = crawled[candidates]
+        key = lambda d: bytes(self._ids[12 * d:12 * d + 12])
+
+        if after is not None:
+            last_score, last_crawled, last_id = after["score"], to_micros(after["crawledAt"]), after["_id"].binary
+            same_score = candidate_scores == last_score
+            tied = same_score & (candidate_crawled == last_crawled)
+            keep = (candidate_scores < last_score) | (same_score & (candidate_crawled < last_crawled))
+            for i in np.flatnonzero(tied).tolist():
+                keep[i] = key(int(candidates[i])) < last_id
+            candidates, candidate_scores, candidate_crawled = \
+                candidates[keep], candidate_scores[keep], candidate_crawled[keep]
+
+        k = offset + limit
+        if len(candidates) > k:
+            # Everything scoring at least the k-th best; ties on the cut-off are kept for the heap
+            threshold = np.partition(candidate_scores, len(candidates) - k)[len(candidates) - k]
+            keep = candidate_scores >= threshold
+            candidates, candidate_scores, candidate_crawled = \
+                candidates[keep], candidate_scores[keep], candidate_crawled[keep]
+
+        top = heapq.nlargest(k, zip(candidate_scores.tolist(), candidate_crawled.tolist(),
+                                    map(key, candidates.tolist())))
+        return [(ObjectId(doc_id), score) for score, _, doc_id in top[offset:]]
+
+    def _source_facet(self, candidates: np.ndarray) -> List[Dict[str, Any]]:
+        sources = np.frombuffer(self._sources, dtype=np.uint32)[candidates]
+        counts = np.bincount(sources, minlength=len(self._source_names))
+        facet = [{"value": name, "count": int(count)}
+                 for name, count in zip(self._source_names, counts.tolist()) if name and count]
+        return sorted(facet, key=lambda bucket: (-bucket["count"], bucket["value"]))
+
+    def _day_facet(self, crawled: np.ndarray) -> List[Dict[str, Any]]:
+        days, counts = np.unique(crawled // DAY_MICROS, return_counts=True)
+        return [{"value": (EPOCH + timedelta(days=int(day))).strftime("%Y-%m-%d"), "count": int(count)}
+                for day, count in zip(days[::-1].tolist(), counts[::-1].tolist())]
+
+    def _signature(self) -> Dict[str, Any]:
+        return {"format": SNAPSHOT_FORMAT, "fields": FIELD_WEIGHTS}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of the index state for ``dumps_state``.
+
+        Only the arrays and lists are copied, so the index can keep growing on
+        the event loop while the copy is pickled in a thread.
+        """
+        return {
+            **self._signature(),
+            "watermark": self.watermark,
+            "ids": bytes(self._ids),
+            "crawled": self._crawled[:],
+            "lengths": self._lengths[:],
+            "sources": self._sources[:],
+            "categories": self._categories[:],
+            "total_length": self._total_length,
+            "postings": {term: (p.last, p.deltas[:], p.tfs[:]) for term, p in self._postings.items()},
+            "source_names": list(self._source_names),
+            "source_lower": list(self._source_lower),
+            "category_names": list(self._category_names),
+        }
+
+    @staticmethod
+    def dumps_state(state: Dict[str, Any]) -> bytes:
+        return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def dumps(self) -> bytes:
+        """Serialize the index"""
+        return self.dumps_state(self.snapshot())
+
+    def loads(self, data: bytes) -> bool:
+        """Restore a snapshot written by ``dumps``; returns False if it was built differently"""
+        state = pickle.loads(data)
+        if any(state.get(name) != value for name, value in self._signature().items()):
+            return False
+        self._reset()
+        self.watermark = state["watermark"]
+        self._ids = bytearray(state["ids"])
+        self._crawled = state["crawled"]
+        self._lengths = state["lengths"]
+        self._sources = state["sources"]
+        self._categories = state["categories"]
+        self._total_length = state["total_length"]
+        for term, (last, deltas, tfs) in state["postings"].items():
+            postings = self._postings[term] = Postings()
+            postings.last, postings.deltas, postings.tfs = last, deltas, tfs
+        self._source_names = state["source_names"]
+        self._source_lower = state["source_lower"]
+        self._category_names = state["category_names"]
+        self._rebuild_lookups()
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        postings = sum(len(p.deltas) for p in self._postings.values())
+        return {
+            "ready": self.ready,
+            "documents": len(self),
+            "terms": len(self._postings),
+            "postings": postings,
+            "postings_mib": round(postings * 6 / 2 ** 20, 1),
+            "watermark": self.watermark,
+        }
+
+
+def _write_snapshot(path: str, state: Dict[str, Any]):
+    data = BM25Index.dumps_state(state)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Readers in other workers never see a partially written file
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class SearchIndexer:
+    """Keep a ``BM25Index`` in step with the collection.
+
+    Each pass lists the ``_id``s of articles crawled since the index
+    watermark (minus ``lookback`` to catch late writes) in ``crawledAt``
+    order, fetches only the ones not yet indexed, analyzes them off the
+    event loop and appends them. It then
+    refreshes the categories of up to ``batch_size`` unclassified articles,
+    since the background classifier sets them after the crawl. Snapshots
+    are written at most every ``snapshot_interval`` seconds and on stop, and
+    read back on start so restarts only index what is new.
+
+    Articles are never updated or removed once indexed; backfills older
+    than ``lookback`` need the snapshot deleted.
+    """
+
+    def __init__(self, collection, index: BM25Index, snapshot_path: Optional[str] = None, batch_size: int = 1000,
+                 interval: float = 10, lookback: float = 3600, snapshot_interval: float = 300):
+        self.collection = collection
+        self.index = index
+        self.snapshot_path = snapshot_path
+        self.batch_size = batch_size
+        self.interval = interval
+        self.lookback = timedelta(seconds=lookback)
+        self.snapshot_interval = snapshot_interval
+        self._task: Optional[asyncio.Task] = None
+        self._dirty = False
+        self._snapshot_at = time.monotonic()
+        self._category_after = -1
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info("Started search indexer")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            await self.save_snapshot()
+
+    async def load_snapshot(self) -> bool:
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return False
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                data = await asyncio.to_thread(f.read)
+            if not self.index.loads(data):
+                logger.warning(f"Ignoring search index snapshot {self.snapshot_path} built with other settings")
+                return False
+        except Exception as e:
+            logger.error(f"Failed to load search index snapshot {self.snapshot_path}: {e}")
+            return False
+        INDEX_DOCUMENTS.set(len(self.index))
+        logger.info(f"Loaded {len(self.index)} articles from search index snapshot")
+        return True
+
+    async def save_snapshot(self):
+        if not self.snapshot_path or not self._dirty:
+            return
+        # Pickling the whole index takes long enough to stall requests; only
+        # the copy is taken on the event loop
+        await asyncio.to_thread(_write_snapshot, self.snapshot_path, self.index.snapshot())
+        self._dirty = False
+        self._snapshot_at = time.monotonic()
+        logger.info(f"Saved search index snapshot with {len(self.index)} articles")
+
+    async def run_once(self) -> int:
+        """Index new articles and refresh categories; returns the number of articles added"""
+        query_filter = {}
+        if self.index.watermark is not None:
+            query_filter["crawledAt"] = {"$gte": self.index.watermark - self.lookback}
+        # Only _ids are read for the overlap, covered by the (crawledAt, _id) index;
+        # documents are fetched just for articles the index has not seen
+        cursor = self.collection.find(query_filter, {"_id": 1}).sort(
+            [("crawledAt", ASCENDING), ("_id", ASCENDING)]
+        ).batch_size(max(self.batch_size, 10000))
+
+        added, batch = 0, []
+        async for doc in cursor:
+            if doc["_id"] not in self.index:
+                batch.append(doc["_id"])
+            if len(batch) >= self.batch_size:
+                added += await self._add(batch)
+                batch = []
+        if batch:
+            added += await self._add(batch)
+
+        await self._refresh_categories()
+        return added
+
+    async def _add(self, ids: List[ObjectId]) -> int:
+        found = {
+            doc["_id"]: doc
+            async for doc in self.collection.find({"_id": {"$in": ids}}, INDEXED_FIELDS)
+        }
+        # Document numbers follow the scan's crawledAt order
+        docs = [found[doc_id] for doc_id in ids if doc_id in found]
+        analyzed = await asyncio.to_thread(lambda: [analyze_document(doc) for doc in docs])
+        added = sum(self.index.add(doc, terms, length) for doc, (terms, length) in zip(docs, analyzed))
+        self._dirty = self._dirty or bool(added)
+        INDEX_DOCUMENTS.set(len(self.index))
+        return added
+
+    async def _refresh_categories(self):
+        unclassified = self.index.unclassified()
+        if not len(unclassified):
+            return
+        # Rotate through the unclassified articles so each pass costs one bounded query
+        pending = unclassified[unclassified > self._category_after]
+        batch = (pending if len(pending) else unclassified)[:self.batch_size]
+        self._category_after = int(batch[-1])
+        ids = [self.index.doc_id(docno) for docno in batch.tolist()]
+        async for doc in self.collection.find({"_id": {"$in": ids}, "category": {"$ne": None}}, {"category": 1}):
+            self.index.set_category(doc["_id"], doc["category"])
+            self._dirty = True
+
+    async def _run(self):
+        if await self.load_snapshot():
+            # Slightly stale results beat falling back to $text while catching up
+            self.index.ready = True
+        while True:
+            try:
+                started = time.monotonic()
+                added = await self.run_once()
+                if added:
+                    logger.info(f"Indexed {added} articles for search in {time.monotonic() - started:.1f}s")
+                if not self.index.ready:
+                    self.index.ready = True
+                    logger.info(f"Search index ready with {len(self.index)} articles")
+                if time.monotonic() - self._snapshot_at >= self.snapshot_interval:
+                    await self.save_snapshot()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Search indexing failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+# Shared by every NewsService; only filled when SEARCH_BACKEND is "local"
+search_index = BM25Index(k1=settings.SEARCH_BM25_K1, b=settings.SEARCH_BM25_B)
+
+
+def start_search_indexer(collection) -> Optional[SearchIndexer]:
+    """Start maintaining ``search_index`` when SEARCH_BACKEND is "local"."""
+    if settings.SEARCH_BACKEND != "local":
+        return None
+    indexer = SearchIndexer(
+        collection,
+        search_index,
+        snapshot_path=settings.SEARCH_INDEX_SNAPSHOT_PATH or None,
+        batch_size=settings.SEARCH_INDEX_BATCH_SIZE,
+        interval=settings.SEARCH_INDEX_INTERVAL,
+        lookback=settings.SEARCH_INDEX_LOOKBACK,
+        snapshot_interval=settings.SEARCH_INDEX_SNAPSHOT_INTERVAL
+    )
+    indexer.start()
+    return indexer
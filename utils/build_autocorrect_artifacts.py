@@ -0,0 +1,26 @@
+"""Precompile the autocorrect lookup structures.
+
+Run once after the vocabulary or SymSpell dictionary changes:
+
+    python -m utils.build_autocorrect_artifacts [output_dir]
+
+The service loads the result on startup instead of parsing the dictionary
+and rebuilding its indexes in every worker.
+"""
+import sys
+
+from config import settings
+
+
+def build(directory: str = None):
+    directory = directory or settings.AUTOCORRECT_ARTIFACT_DIR
+    # Force the service to build everything from the raw sources
+    settings.AUTOCORRECT_ARTIFACT_DIR = ""
+    from services import auto_correct_service
+
+    auto_correct_service.save_artifacts(directory)
+    print(f"Autocorrect artifacts written to {directory}")
+
+
+if __name__ == "__main__":
+    build(sys.argv[1] if len(sys.argv) > 1 else None)
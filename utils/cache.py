@@ -0,0 +1,78 @@
+import functools
+import inspect
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from cachetools import TTLCache
+
+_MISSING = object()
+
+
+class InstrumentedTTLCache(TTLCache):
+    """TTL/LRU cache that counts hits, misses and capacity evictions."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def popitem(self):
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.currsize,
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+        }
+
+
+def memoized(cache: InstrumentedTTLCache, namespace: str,
+             normalize: Optional[Dict[str, Callable[[Any], Any]]] = None):
+    """Memoize ``func`` in a shared ``cache``.
+
+    Keys are ``(namespace, *arguments)`` with defaults applied, so calls that
+    differ only in how arguments are passed share an entry. ``normalize``
+    maps argument names to functions applied before keying. List results are
+    stored as tuples and handed back as fresh lists, so callers cannot mutate
+    the cached value.
+    """
+    normalize = normalize or {}
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (namespace,) + tuple(
+                normalize[name](value) if name in normalize else value
+                for name, value in bound.arguments.items()
+            )
+            with cache.lock:
+                try:
+                    value = cache[key]
+                    cache.hits += 1
+                except KeyError:
+                    cache.misses += 1
+                    value = _MISSING
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                if isinstance(value, list):
+                    value = tuple(value)
+                with cache.lock:
+                    cache[key] = value
+            return list(value) if isinstance(value, tuple) else value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
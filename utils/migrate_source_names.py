@@ -0,0 +1,91 @@
+"""Backfill ``sourceNameLower`` on existing news articles.
+
+The source filter matches on this normalized field, so documents written
+before it existed must be migrated once:
+
+    python -m utils.migrate_source_names
+
+Articles the crawler inserts without the field are picked up while the
+service runs by ``SourceNameBackfill``.
+"""
+import asyncio
+from typing import Optional
+
+from loguru import logger
+
+from config import settings
+from database import connect_to_mongo, close_mongo_connection, db
+from services.news_service import normalize_source_name
+
+
+async def backfill_source_names(collection, only_missing: bool = False) -> int:
+    """Set sourceNameLower wherever it is missing (or, unless ``only_missing``, stale).
+
+    Names are normalized in Python, one ``update_many`` per distinct source,
+    so stored values match the filter exactly for non-ASCII names too
+    (MongoDB's ``$toLower``/``$trim`` only handle ASCII). Missing values
+    are found through the (sourceNameLower, crawledAt) index.
+    """
+    missing = {"sourceNameLower": None}
+    names = await collection.distinct("sourceName", missing if only_missing else {})
+    modified = 0
+    for name in names:
+        if not isinstance(name, str):
+            continue
+        normalized = normalize_source_name(name)
+        stale = missing if only_missing else {"sourceNameLower": {"$ne": normalized}}
+        result = await collection.update_many({"sourceName": name, **stale}, {"$set": {"sourceNameLower": normalized}})
+        modified += result.modified_count
+    return modified
+
+
+class SourceNameBackfill:
+    """Periodically normalize source names of articles inserted without ``sourceNameLower``."""
+
+    def __init__(self, collection, interval: float = 60):
+        self.collection = collection
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                modified = await backfill_source_names(self.collection, only_missing=True)
+                if modified:
+                    logger.info(f"Backfilled sourceNameLower on {modified} articles")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Source name backfill failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+def start_source_name_backfill(collection) -> Optional[SourceNameBackfill]:
+    """Start the backfill every SOURCE_NAME_BACKFILL_INTERVAL seconds (0 disables it)"""
+    if not settings.SOURCE_NAME_BACKFILL_INTERVAL:
+        return None
+    backfill = SourceNameBackfill(collection, settings.SOURCE_NAME_BACKFILL_INTERVAL)
+    backfill.start()
+    return backfill
+
+
+async def main():
+    await connect_to_mongo()
+    try:
+        modified = await backfill_source_names(db.collection)
+        logger.info(f"Backfilled sourceNameLower on {modified} articles")
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+_MISSING = object()
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident set size of this process (Linux), or None where unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class ModelRegistry:
+    """Named model artifacts, each loaded at most once.
+
+    Artifacts register a zero-argument loader and are built on the first
+    ``get`` (one lock per name, so unrelated artifacts load in parallel and
+    a loader may ``get`` the artifacts it depends on). ``load_all`` and
+    ``load_all_async`` warm everything up front on a thread pool. Load time
+    and resident-memory growth are recorded per artifact; when loads
+    overlap the memory figures are approximate.
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._values: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        if name in self._loaders:
+            raise ValueError(f"Model artifact already registered: {name}")
+        self._loaders[name] = loader
+        self._locks[name] = threading.Lock()
+
+    def get(self, name: str) -> Any:
+        value = self._values.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        if name not in self._loaders:
+            raise KeyError(f"Unknown model artifact: {name}")
+        with self._locks[name]:
+            value = self._values.get(name, _MISSING)
+            if value is _MISSING:
+                value = self._load(name)
+        return value
+
+    def _load(self, name: str) -> Any:
+        rss_before = _rss_bytes()
+        start = time.perf_counter()
+        value = self._loaders[name]()
+        seconds = time.perf_counter() - start
+        rss_after = _rss_bytes()
+        memory = max(rss_after - rss_before, 0) if rss_before is not None and rss_after is not None else None
+        self._stats[name] = {"load_seconds": round(seconds, 4), "memory_bytes": memory}
+        self._values[name] = value
+        logger.info(f"Loaded {name} in {seconds:.2f}s" + (f" (+{memory / 2 ** 20:.1f} MiB)" if memory else ""))
+        return value
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._values
+
+    def names(self) -> List[str]:
+        return list(self._loaders)
+
+    def load_all(self, workers: int = 4):
+        """Load every registered artifact, several at a time"""
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="model-load") as pool:
+            for _ in pool.map(self.get, self.names()):
+                pass
+
+    async def load_all_async(self, workers: int = 4):
+        await asyncio.get_running_loop().run_in_executor(None, self.load_all, workers)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {"loaded": name in self._values, **self._stats.get(name, {})}
+            for name in self._loaders
+        }
+
+
+registry = ModelRegistry()
@@ -0,0 +1,10 @@
+import hashlib
+
+
+def model_version(name: str, *paths: str) -> str:
+    """Stable version tag for a model: its name plus a digest of its pickled components."""
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return f"{name}-{digest.hexdigest()[:12]}"
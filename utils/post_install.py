@@ -1,5 +1,18 @@
+import ssl
+
+import nltk
 import spacy.cli
 
 
 def download_model():
     spacy.cli.download("en_core_web_sm")
+
+
+def download_nltk_data():
+    nltk.download("stopwords")
+
+
+if __name__ == "__main__":
+    ssl._create_default_https_context = ssl._create_unverified_context
+    download_model()
+    download_nltk_data()
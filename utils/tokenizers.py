@@ -1,24 +1,96 @@
-### File: utils/tokenizers.py
-import spacy
+import multiprocessing
 import string
-import ssl
+import threading
+from typing import Iterable, Iterator, List, Optional
 
+from cachetools import LRUCache
 
-ssl._create_default_https_context = ssl._create_unverified_context
+from config import settings
+from utils.model_registry import registry
 
+# Lemmas only need tok2vec, tagger, attribute_ruler and the lemmatizer; the
+# parser and NER are the slowest parts of en_core_web_sm and are never used
+_UNUSED_COMPONENTS = ["parser", "senter", "ner"]
 
-# Attempt to load spaCy model and download if missing
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    from spacy.cli import download
-    download("en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
 
-def remove_stopwords_and_lemmatize(text):
-    doc = nlp(text.lower())
-    return [
-        token.lemma_
-        for token in doc
-        if not token.is_stop and not token.is_punct and token.lemma_ not in string.punctuation
-    ]
+def _load_spacy():
+    import spacy
+    # Installed at build time (python -m utils.post_install); never downloaded at runtime
+    try:
+        nlp = spacy.load("en_core_web_sm", exclude=_UNUSED_COMPONENTS)
+    except OSError as e:
+        raise RuntimeError("spaCy model en_core_web_sm is missing; run `python -m utils.post_install`") from e
+    # The lemmatizer runs after the pipeline through the token lemma cache
+    lemmatizer = None
+    if "lemmatizer" in nlp.pipe_names:
+        lemmatizer = nlp.get_pipe("lemmatizer")
+        nlp.disable_pipe("lemmatizer")
+    return nlp, lemmatizer
+
+
+registry.register("spacy.en_core_web_sm", _load_spacy)
+
+# Frequent tokens are lemmatized once. As in spaCy's own rule lemmatizer, the
+# lemma depends only on the word, its POS tag and morphology, so the cache is
+# keyed on those and never on the surrounding text
+_LEMMAS = LRUCache(maxsize=settings.SPACY_LEMMA_CACHE_SIZE)
+_LEMMAS_LOCK = threading.Lock()
+
+
+def _lemma(token, lemmatizer) -> str:
+    # Lemmas already assigned by the attribute ruler take precedence, as in the pipeline
+    if lemmatizer is None or token.lemma:
+        return token.lemma_
+    key = (token.orth, token.pos, token.morph.key)
+    with _LEMMAS_LOCK:
+        lemma = _LEMMAS.get(key)
+    if lemma is None:
+        lemma = lemmatizer.lemmatize(token)[0]
+        with _LEMMAS_LOCK:
+            _LEMMAS[key] = lemma
+    return lemma
+
+
+def _doc_tokens(doc, lemmatizer) -> List[str]:
+    # is_stop and is_punct are lexical, so filtered tokens are never lemmatized
+    tokens = []
+    for token in doc:
+        if token.is_stop or token.is_punct:
+            continue
+        lemma = _lemma(token, lemmatizer)
+        if lemma not in string.punctuation:
+            tokens.append(lemma)
+    return tokens
+
+
+def remove_stopwords_and_lemmatize(text: str) -> List[str]:
+    nlp, lemmatizer = registry.get("spacy.en_core_web_sm")
+    return _doc_tokens(nlp(text.lower()), lemmatizer)
+
+
+def lemmatize_stream(texts: Iterable[str], batch_size: Optional[int] = None,
+                     n_process: Optional[int] = None) -> Iterator[List[str]]:
+    """Yield ``remove_stopwords_and_lemmatize`` tokens for each text, in order.
+
+    Texts go through ``nlp.pipe`` in batches of ``batch_size``, so any iterable
+    (e.g. a database cursor) is consumed lazily. With ``n_process`` > 1 the
+    tagging runs in worker processes; lemmas are still resolved here so the
+    cache is shared.
+    """
+    nlp, lemmatizer = registry.get("spacy.en_core_web_sm")
+    n_process = n_process or settings.SPACY_N_PROCESS
+    # Pool workers (CLASSIFICATION_EXECUTOR=process) are daemonic and cannot fork
+    if n_process != 1 and multiprocessing.current_process().daemon:
+        n_process = 1
+    docs = nlp.pipe((text.lower() for text in texts), batch_size=batch_size or settings.SPACY_BATCH_SIZE,
+                    n_process=n_process)
+    for doc in docs:
+        yield _doc_tokens(doc, lemmatizer)
+
+
+def lemmatize_batch(texts: List[str], batch_size: Optional[int] = None,
+                    n_process: Optional[int] = None) -> List[List[str]]:
+    """Tokens for a list of texts; small batches skip the process start-up cost."""
+    if n_process is None and len(texts) < settings.SPACY_MULTIPROCESS_MIN_TEXTS:
+        n_process = 1
+    return list(lemmatize_stream(texts, batch_size, n_process))